@@ -6,8 +6,9 @@ Command-line interface for processing invoices and extracting structured data.
 """
 
 import argparse
+import os
 import sys
-from pathlib import Path
+from functools import lru_cache
 
 from src.services.processing_service import ProcessingService
 from src.core.logging_config import setup_logging, get_logger
@@ -19,6 +20,20 @@ setup_logging(level=settings.log_level, format_string=settings.log_format)
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_service() -> ProcessingService:
+    """
+    Get the shared processing service.
+    
+    Reusing one service keeps the Veryfi client and its HTTP connection pool
+    alive across calls instead of rebuilding them per file.
+    
+    Returns:
+        ProcessingService instance
+    """
+    return ProcessingService()
+
+
 def process_single_file(file_path: str, output_dir: str = "output") -> bool:
     """
     Process a single invoice file.
@@ -31,8 +46,8 @@ def process_single_file(file_path: str, output_dir: str = "output") -> bool:
         True if processing succeeded, False otherwise
     """
     try:
-        # Create processing service
-        processing_service = ProcessingService()
+        # Get shared processing service
+        processing_service = _get_service()
         
         # Process file
         result = processing_service.process_single_file(file_path, output_dir)
@@ -57,8 +72,8 @@ def process_all_invoices(invoices_dir: str = "invoices", output_dir: str = "outp
         output_dir: Directory to save JSON output files
     """
     try:
-        # Create processing service
-        processing_service = ProcessingService()
+        # Get shared processing service
+        processing_service = _get_service()
         
         # Process all invoices
         summary = processing_service.process_all_invoices(invoices_dir, output_dir)
@@ -94,10 +109,22 @@ def main():
         help='Directory to save JSON output files (default: output)'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Number of concurrent API requests (default: MAX_WORKERS setting)'
+    )
+    
     args = parser.parse_args()
     
-    # Create output directory
-    Path(args.output_dir).mkdir(parents=True, exist_ok=True)
+    # Override concurrency from the command line
+    if args.workers is not None:
+        settings.max_workers = max(1, args.workers)
+        settings.enable_parallel_processing = settings.max_workers > 1
+    
+    # Normalize and create output directory once; plain strings are passed downstream
+    args.output_dir = os.path.abspath(os.path.expanduser(args.output_dir))
+    os.makedirs(args.output_dir, exist_ok=True)
     
     try:
         if args.file:
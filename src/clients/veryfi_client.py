@@ -5,22 +5,86 @@ Handles communication with Veryfi OCR API to extract text from PDF documents.
 """
 
 import os
+import functools
 import hashlib
-from typing import Optional, Dict, Any, List
-from dotenv import load_dotenv
+from typing import Optional, Dict, Any, List, Sequence
 import veryfi
+from requests.adapters import HTTPAdapter
 from ..core.logging_config import get_logger
 from ..core.retry import retry, CircuitBreaker
 from ..core.exceptions import APIError
 from ..core.cache import get_cache
 from ..config.settings import get_settings
 
-# Load environment variables
-load_dotenv()
-
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Sentinel for missing keys (None is a legitimate response value)
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=256)
+def _file_digest(path: str, size: int, mtime_ns: int) -> str:
+    """
+    Hash file content, memoized per (path, size, mtime).
+    
+    A file that is hashed for de-duplication is not read again to build its
+    response cache key; size and mtime are part of the key only so that a
+    changed file gets a fresh digest. The cache is bounded, so long-running
+    processes do not accumulate digests for every file ever seen.
+    
+    Args:
+        path: Absolute path to file
+        size: File size in bytes (cache key only)
+        mtime_ns: File modification time in nanoseconds (cache key only)
+        
+    Returns:
+        BLAKE2b (128-bit) hex digest of file content
+    """
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+        
+        file_hash = hashlib.blake2b(digest_size=16)
+        buffer = memoryview(bytearray(1 << 20))  # Reused 1 MiB read buffer
+        while True:
+            size_read = f.readinto(buffer)
+            if not size_read:
+                break
+            file_hash.update(buffer[:size_read])
+        return file_hash.hexdigest()
+
+
+def _get_path_value(data: Any, keys: Sequence[str], default: Any = None) -> Any:
+    """
+    Walk a key path through nested dictionaries.
+    
+    Shared by safe_get_nested_value and extract_structured_field so path
+    lookups avoid re-packing keys into *args on every attempt.
+    
+    Args:
+        data: Dictionary to extract from
+        keys: Keys to traverse in order
+        default: Value returned if the path is missing or ends at None
+        
+    Returns:
+        Value at the path, or default. A Veryfi {'value': ...} node is
+        unwrapped as-is, so an explicit {'value': None} yields None.
+    """
+    current = data
+    for key in keys:
+        if not isinstance(current, dict):
+            return default
+        current = current.get(key, _MISSING)
+        if current is _MISSING:
+            return default
+    
+    # If current is a dict with 'value' key, return that (Veryfi format)
+    if isinstance(current, dict) and 'value' in current:
+        return current['value']
+    
+    return current if current is not None else default
+
 
 class VeryfiClient:
     """
@@ -33,14 +97,17 @@ class VeryfiClient:
         """
         Initialize Veryfi client with credentials from environment variables.
         
+        Credentials are read once into Settings (which loads the .env file)
+        rather than from the environment on every construction.
+        
         Raises:
             ValueError: If required credentials are missing
         """
-        self.client_id = os.getenv('VERYFI_CLIENT_ID')
-        self.username = os.getenv('VERYFI_USERNAME')
-        self.api_key = os.getenv('VERYFI_API_KEY')
+        self.client_id = settings.veryfi_client_id
+        self.username = settings.veryfi_username
+        self.api_key = settings.veryfi_api_key
         
-        if not all([self.client_id, self.username, self.api_key]):
+        if not (self.client_id and self.username and self.api_key):
             raise ValueError(
                 "Missing Veryfi API credentials. Please set VERYFI_CLIENT_ID, "
                 "VERYFI_USERNAME, and VERYFI_API_KEY in your .env file."
@@ -54,6 +121,13 @@ class VeryfiClient:
             api_key=self.api_key
         )
         
+        # Size the SDK's connection pool for concurrent requests so TLS
+        # connections are reused across the batch
+        session = getattr(self.client, '_session', None)
+        if session is not None:
+            pool_size = max(settings.max_workers, 10)
+            session.mount('https://', HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size))
+        
         # Initialize cache if enabled
         self.cache = get_cache() if settings.enable_caching else None
         
@@ -70,21 +144,38 @@ class VeryfiClient:
             logger.info(f"Caching enabled with TTL: {settings.cache_ttl}s")
         logger.info("Circuit breaker enabled for API calls")
     
-    def _get_file_hash(self, file_path: str) -> str:
+    @staticmethod
+    def get_file_hash(file_path: str) -> str:
         """
         Generate hash of file content for cache key.
         
+        Digests are remembered per (path, size, mtime), so repeated calls for
+        an unchanged file cost a stat() instead of a full read.
+        
         Args:
             file_path: Path to file
             
         Returns:
-            SHA256 hash of file content
+            BLAKE2b (128-bit) hex digest of file content
+        """
+        stat = os.stat(file_path)
+        return _file_digest(os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+    
+    @retry(exceptions=(Exception,))
+    def _process_with_retry(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Send a document to the Veryfi API with retry and circuit breaker protection.
+        
+        Decorated once at class definition rather than per call.
+        
+        Args:
+            file_path: Path to the PDF file to process
+            
+        Returns:
+            Dictionary containing API response
         """
-        hash_sha256 = hashlib.sha256()
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_sha256.update(chunk)
-        return hash_sha256.hexdigest()
+        # Use circuit breaker to protect against cascading failures
+        return self.circuit_breaker.call(self.client.process_document, file_path)
     
     def process_document(self, file_path: str) -> Optional[Dict[str, Any]]:
         """
@@ -107,35 +198,28 @@ class VeryfiClient:
         # Check cache if enabled
         cache_key = None
         if self.cache and settings.enable_caching:
-            cache_key = f"veryfi_response:{self._get_file_hash(file_path)}"
+            cache_key = f"veryfi_response:{self.get_file_hash(file_path)}"
             cached_response = self.cache.get(cache_key)
             if cached_response is not None:
-                logger.info(f"Cache hit for document: {file_path}")
+                logger.info("Cache hit for document: %s", file_path)
                 return cached_response
         
         try:
-            logger.info(f"Processing document: {file_path}")
+            logger.info("Processing document: %s", file_path)
             
             # Process document with Veryfi API (with retry and circuit breaker)
-            @retry(exceptions=(Exception,))
-            def _process():
-                # Use circuit breaker to protect against cascading failures
-                return self.circuit_breaker.call(
-                    lambda: self.client.process_document(file_path)
-                )
-            
-            response = _process()
+            response = self._process_with_retry(file_path)
             
             # Cache response if enabled
             if self.cache and settings.enable_caching and cache_key and response:
                 self.cache.set(cache_key, response)
-                logger.debug(f"Cached response for document: {file_path}")
+                logger.debug("Cached response for document: %s", file_path)
             
-            logger.info(f"Successfully processed document: {file_path}")
+            logger.info("Successfully processed document: %s", file_path)
             return response
             
         except Exception as e:
-            logger.error(f"Error processing {file_path}: {str(e)}")
+            logger.error("Error processing %s: %s", file_path, e)
             raise
     
     def extract_ocr_text(self, file_path: str) -> Optional[str]:
@@ -189,18 +273,7 @@ class VeryfiClient:
         Returns:
             Extracted value or default
         """
-        current = data
-        for key in keys:
-            if isinstance(current, dict) and key in current:
-                current = current[key]
-            else:
-                return default
-        
-        # If current is a dict with 'value' key, return that (Veryfi format)
-        if isinstance(current, dict) and 'value' in current:
-            return current['value']
-        
-        return current if current is not None else default
+        return _get_path_value(data, keys, default)
     
     @staticmethod
     def extract_structured_field(response: Dict[str, Any], field_path: List[str], 
@@ -220,14 +293,14 @@ class VeryfiClient:
             return None
         
         # Try primary path
-        value = VeryfiClient.safe_get_nested_value(response, *field_path)
+        value = _get_path_value(response, field_path)
         if value:
             return value
         
         # Try alternative paths
         if alternative_paths:
             for alt_path in alternative_paths:
-                value = VeryfiClient.safe_get_nested_value(response, *alt_path)
+                value = _get_path_value(response, alt_path)
                 if value:
                     return value
         
@@ -4,93 +4,268 @@ Regex pattern definitions.
 Centralizes all regex patterns used for extraction.
 """
 
+import functools
 import re
-from typing import List, Pattern, Optional
+from typing import Dict, FrozenSet, List, Pattern, Optional
+from .settings import get_settings
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    import regex
+except ImportError:
+    regex = None
+
+# re flags used below and their inline form, which RE2 also understands
+_INLINE_FLAGS = ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'))
+
+# Patterns that open with a literal keyword (or an alternation of keywords).
+# The regex module searches for such prefixes much faster than re, but is
+# slower than re on patterns that open with a character class.
+_LITERAL_PREFIX = re.compile(r'[A-Za-z#]|\(\?:[A-Za-z#]+(?:\|[A-Za-z#]+)*\)')
+
+
+# False positives to exclude from invoice number extraction
+_INVOICE_NUMBER_EXCLUSIONS = frozenset({
+    'page', 'switch', 'date', 'invoice', 'total', 'amount', 'quantity',
+    'description', 'sku', 'item', 'account', 'number', 'po', 'services'
+})
+
+
+def _scoped(pattern: str, flags: int) -> str:
+    """Wrap a pattern in a group carrying its flags inline, e.g. (?i:...)."""
+    inline = ''.join(char for flag, char in _INLINE_FLAGS if flags & flag)
+    return f'(?{inline}:{pattern})'
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str, flags: int, use_re2: bool, use_regex_module: bool = False) -> Pattern:
+    """
+    Compile a pattern once per (source, flags, engine).
+    
+    Compiled patterns are immutable, so every PatternConfig instance (e.g.
+    ones created in tests via set_patterns) shares the same objects.
+    """
+    if use_re2:
+        try:
+            return re2.compile(_scoped(pattern, flags))
+        except re2.error:
+            pass
+    elif use_regex_module and _LITERAL_PREFIX.match(pattern):
+        # regex uses the same flag values as re
+        return regex.compile(pattern, flags)
+    return re.compile(pattern, flags)
 
 
 class PatternConfig:
     """
     Configuration for regex patterns.
     
-    Compiles patterns once for performance.
+    Compiles patterns once for performance. When USE_RE2 is enabled and
+    google-re2 is installed, patterns are compiled with RE2 (linear-time,
+    no backtracking); any pattern RE2 rejects falls back to re. Otherwise,
+    when USE_REGEX_MODULE is enabled and regex is installed, patterns that
+    open with a literal keyword are compiled with the regex module.
     """
     
-    def __init__(self):
-        """Initialize and compile all patterns."""
+    __slots__ = (
+        'use_re2', 'use_regex_module', 'date_patterns', 'invoice_number_patterns',
+        'invoice_number_exclusions', 'price_pattern', 'signed_price_pattern',
+        'negative_price_pattern', 'tax_rate_pattern', 'sku_patterns', 'vendor_patterns',
+        'bill_to_patterns', 'address_pattern', 'date_section_patterns', 'date_section_pattern',
+        'pattern_keywords', '_combined',
+    )
+    
+    def __init__(self, use_re2: Optional[bool] = None, use_regex_module: Optional[bool] = None):
+        """
+        Initialize and compile all patterns.
+        
+        Args:
+            use_re2: Compile with RE2 (defaults to settings.use_re2)
+            use_regex_module: Compile keyword-led patterns with the regex module
+                (defaults to settings.use_regex_module)
+        """
+        if use_re2 is None:
+            use_re2 = get_settings().use_re2
+        if use_regex_module is None:
+            use_regex_module = get_settings().use_regex_module
+        self.use_re2 = bool(use_re2) and re2 is not None
+        self.use_regex_module = bool(use_regex_module) and regex is not None
+        
         # Date patterns (compiled for performance)
         self.date_patterns = [
-            re.compile(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}'),  # MM/DD/YYYY, DD/MM/YYYY
-            re.compile(r'\d{4}[/-]\d{1,2}[/-]\d{1,2}'),    # YYYY/MM/DD
-            re.compile(r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4}'),  # Month DD, YYYY
+            self._compile(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}'),  # MM/DD/YYYY, DD/MM/YYYY
+            self._compile(r'\d{4}[/-]\d{1,2}[/-]\d{1,2}'),    # YYYY/MM/DD
+            self._compile(r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4}'),  # Month DD, YYYY
         ]
         
         # Invoice number patterns (compiled)
         # Prioritize numeric invoice numbers (6-20 digits) and labeled sections
         self.invoice_number_patterns = [
             # Pattern 1: "Invoice No." or "Invoice Number:" followed by number (most reliable)
-            re.compile(r'invoice\s+(?:no\.?|number)\s*:?\s*([0-9]{6,20})', re.IGNORECASE),
+            self._compile(r'invoice\s+(?:no\.?|number)\s*:?\s*([0-9]{6,20})', re.IGNORECASE),
             # Pattern 2: "Inv #" or "Invoice #" followed by number
-            re.compile(r'(?:invoice|inv)\s*#\s*:?\s*([0-9]{6,20})', re.IGNORECASE),
+            self._compile(r'(?:invoice|inv)\s*#\s*:?\s*([0-9]{6,20})', re.IGNORECASE),
             # Pattern 3: Standalone numeric invoice numbers (6-20 digits, common format)
-            re.compile(r'\b([0-9]{6,20})\b'),
+            self._compile(r'\b([0-9]{6,20})\b'),
             # Pattern 4: Alphanumeric with hyphens (fallback)
-            re.compile(r'(?:invoice|inv|#)\s*:?\s*([A-Z0-9\-]{6,20})', re.IGNORECASE),
+            self._compile(r'(?:invoice|inv|#)\s*:?\s*([A-Z0-9\-]{6,20})', re.IGNORECASE),
             # Pattern 5: Invoice number label with alphanumeric
-            re.compile(r'invoice\s+number\s*:?\s*([A-Z0-9\-]{6,20})', re.IGNORECASE),
+            self._compile(r'invoice\s+number\s*:?\s*([A-Z0-9\-]{6,20})', re.IGNORECASE),
         ]
         
         # False positives to exclude from invoice number extraction
-        self.invoice_number_exclusions = {
-            'page', 'switch', 'date', 'invoice', 'total', 'amount', 'quantity',
-            'description', 'sku', 'item', 'account', 'number', 'po', 'services'
-        }
+        self.invoice_number_exclusions = _INVOICE_NUMBER_EXCLUSIONS
         
         # Price patterns (compiled) - updated to handle negative values
-        self.price_pattern = re.compile(r'[-\+]?\$?\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)')
+        self.price_pattern = self._compile(r'[-\+]?\$?\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)')
+        # Same matches as price_pattern, with the sign and amount as named groups
+        # so one scan yields both
+        self.signed_price_pattern = self._compile(
+            r'(?P<sign>[-\+])?\$?\s*(?P<amount>\d{1,3}(?:,\d{3})*(?:\.\d{2})?)'
+        )
         # Pattern to detect if price is negative (for discounts/credits)
-        self.negative_price_pattern = re.compile(r'-\$?\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)')
-        self.tax_rate_pattern = re.compile(r'(\d+\.?\d*)\s*%')
+        self.negative_price_pattern = self._compile(r'-\$?\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)')
+        self.tax_rate_pattern = self._compile(r'(\d+\.?\d*)\s*%')
         
         # SKU patterns (compiled)
         self.sku_patterns = [
-            re.compile(r'sku\s*:?\s*([A-Z0-9\-]+)', re.IGNORECASE),
-            re.compile(r'item\s*#\s*:?\s*([A-Z0-9\-]+)', re.IGNORECASE),
-            re.compile(r'product\s*code\s*:?\s*([A-Z0-9\-]+)', re.IGNORECASE),
+            self._compile(r'sku\s*:?\s*([A-Z0-9\-]+)', re.IGNORECASE),
+            self._compile(r'item\s*#\s*:?\s*([A-Z0-9\-]+)', re.IGNORECASE),
+            self._compile(r'product\s*code\s*:?\s*([A-Z0-9\-]+)', re.IGNORECASE),
             # Enhanced patterns for codes at line start
-            re.compile(r'^([A-Z0-9\-]{3,15})\s+', re.IGNORECASE),
+            self._compile(r'^([A-Z0-9\-]{3,15})\s+', re.IGNORECASE),
             # Codes in parentheses (common product code format)
-            re.compile(r'\(([A-Z0-9\-]{3,20})\)'),
+            self._compile(r'\(([A-Z0-9\-]{3,20})\)'),
         ]
         
         # Vendor patterns (compiled)
         self.vendor_patterns = [
-            re.compile(r'(?:from|vendor|supplier)\s*:?\s*(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE),
-            re.compile(r'^([A-Z][A-Za-z\s&]+(?:Inc|LLC|Corp|Ltd|Company|Co)\.?)', re.MULTILINE),
+            self._compile(r'(?:from|vendor|supplier)\s*:?\s*(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE),
+            self._compile(r'^([A-Z][A-Za-z\s&]+(?:Inc|LLC|Corp|Ltd|Company|Co)\.?)', re.MULTILINE),
         ]
         
         # Bill to patterns (compiled)
         self.bill_to_patterns = [
-            re.compile(r'bill\s+to\s*:?\s*(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE),
-            re.compile(r'bill\s+to\s*:?\s*\n\s*([A-Z][A-Za-z\s&]+)', re.IGNORECASE | re.MULTILINE),
-            re.compile(r'sold\s+to\s*:?\s*(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE),
-            re.compile(r'customer\s*:?\s*(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE),
+            self._compile(r'bill\s+to\s*:?\s*(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE),
+            self._compile(r'bill\s+to\s*:?\s*\n\s*([A-Z][A-Za-z\s&]+)', re.IGNORECASE | re.MULTILINE),
+            self._compile(r'sold\s+to\s*:?\s*(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE),
+            self._compile(r'customer\s*:?\s*(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE),
         ]
         
         # Address patterns (compiled)
-        self.address_pattern = re.compile(
+        self.address_pattern = self._compile(
             r'(\d+\s+[A-Za-z0-9\s,]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr)[\s\S]{0,200}?(?:\d{5}(?:-\d{4})?))',
             re.IGNORECASE
         )
         
         # Date section patterns (compiled) - improved to catch various formats
         self.date_section_patterns = [
-            re.compile(r'invoice\s+date\s*:?\s*([^\n]+)', re.IGNORECASE),
-            re.compile(r'date\s*:?\s*([^\n]+)', re.IGNORECASE),
-            re.compile(r'bill\s+date\s*:?\s*([^\n]+)', re.IGNORECASE),
-            re.compile(r'invoice\s+date\s*([^\n]+)', re.IGNORECASE),
+            self._compile(r'invoice\s+date\s*:?\s*([^\n]+)', re.IGNORECASE),
+            self._compile(r'date\s*:?\s*([^\n]+)', re.IGNORECASE),
+            self._compile(r'bill\s+date\s*:?\s*([^\n]+)', re.IGNORECASE),
+            self._compile(r'invoice\s+date\s*([^\n]+)', re.IGNORECASE),
         ]
         # Keep old pattern for backward compatibility
         self.date_section_pattern = self.date_section_patterns[1]
+        
+        # Literal keywords (lowercase) a pattern needs in the text to match at all,
+        # checked with a substring search before running the regex
+        self.pattern_keywords = {
+            self.invoice_number_patterns[0]: ('invoice',),
+            self.invoice_number_patterns[1]: ('inv',),
+            self.invoice_number_patterns[3]: ('inv', '#'),
+            self.invoice_number_patterns[4]: ('invoice',),
+            self.sku_patterns[0]: ('sku',),
+            self.sku_patterns[1]: ('item',),
+            self.sku_patterns[2]: ('product',),
+            self.vendor_patterns[0]: ('from', 'vendor', 'supplier'),
+            self.bill_to_patterns[0]: ('bill',),
+            self.bill_to_patterns[1]: ('bill',),
+            self.bill_to_patterns[2]: ('sold',),
+            self.bill_to_patterns[3]: ('customer',),
+        }
+        for pattern in self.date_section_patterns:
+            self.pattern_keywords[pattern] = ('date',)
+        
+        # Single-pass alternations of each pattern list, keyed by group name
+        # ('vendor' -> vendor_patterns). Callers still walk the list in priority
+        # order; these only tell them in one scan whether any pattern of the list
+        # can match, so the per-pattern loop can be skipped. They are only needed
+        # on fallback paths, so each is compiled on first use.
+        self._combined: Dict[str, Pattern] = {}
+    
+    def _compile(self, pattern: str, flags: int = 0) -> Pattern:
+        """
+        Compile a pattern with the configured regex engine.
+        
+        Args:
+            pattern: Regex source
+            flags: re flags (IGNORECASE, MULTILINE, DOTALL)
+            
+        Returns:
+            Compiled pattern (RE2, regex or re)
+        """
+        return _compile_pattern(pattern, flags, self.use_re2, self.use_regex_module)
+    
+    def _get_combined(self, group: str) -> Pattern:
+        """
+        Get the alternation for a pattern group, compiling it on first use.
+        
+        Args:
+            group: Group name, e.g. 'vendor' for vendor_patterns
+            
+        Returns:
+            Compiled alternation
+        """
+        combined = self._combined.get(group)
+        if combined is None:
+            combined = self._combined[group] = self._combine(getattr(self, f'{group}_patterns'))
+        return combined
+    
+    def _combine(self, patterns: List[Pattern]) -> Pattern:
+        """
+        Compile one alternation matching wherever any of the patterns matches.
+        
+        Each alternative keeps its own flags as a scoped inline group.
+        
+        Args:
+            patterns: Compiled patterns (re or RE2)
+            
+        Returns:
+            Compiled alternation
+        """
+        return self._compile('|'.join(
+            _scoped(pattern.pattern, getattr(pattern, 'flags', None) or 0)
+            for pattern in patterns
+        ))
+    
+    def candidate_patterns(self, patterns: List[Pattern], text: str) -> List[Pattern]:
+        """
+        Filter out patterns whose required keywords do not occur in the text.
+        
+        Order is preserved. Only applied to ASCII text, where lowercasing is
+        exactly what IGNORECASE matches against; other text keeps every pattern.
+        
+        Args:
+            patterns: Compiled patterns in priority order
+            text: Text the patterns will be run on
+            
+        Returns:
+            Patterns that can still match the text
+        """
+        if not text.isascii():
+            return patterns
+        
+        text_lower = text.lower()
+        keywords = self.pattern_keywords
+        return [
+            pattern for pattern in patterns
+            if pattern not in keywords or any(kw in text_lower for kw in keywords[pattern])
+        ]
     
     def get_date_patterns(self) -> List[Pattern]:
         """Get compiled date patterns."""
@@ -100,10 +275,38 @@ class PatternConfig:
         """Get compiled invoice number patterns."""
         return self.invoice_number_patterns
     
+    def get_invoice_number_combined(self) -> Pattern:
+        """Get single-pass alternation of the invoice number patterns."""
+        return self._get_combined('invoice_number')
+    
+    def get_date_combined(self) -> Pattern:
+        """Get single-pass alternation of the date patterns."""
+        return self._get_combined('date')
+    
+    def get_sku_combined(self) -> Pattern:
+        """Get single-pass alternation of the SKU patterns."""
+        return self._get_combined('sku')
+    
+    def get_vendor_combined(self) -> Pattern:
+        """Get single-pass alternation of the vendor patterns."""
+        return self._get_combined('vendor')
+    
+    def get_bill_to_combined(self) -> Pattern:
+        """Get single-pass alternation of the bill to patterns."""
+        return self._get_combined('bill_to')
+    
+    def get_date_section_combined(self) -> Pattern:
+        """Get single-pass alternation of the date section patterns."""
+        return self._get_combined('date_section')
+    
     def get_price_pattern(self) -> Pattern:
         """Get compiled price pattern."""
         return self.price_pattern
     
+    def get_signed_price_pattern(self) -> Pattern:
+        """Get compiled price pattern with named sign/amount groups."""
+        return self.signed_price_pattern
+    
     def get_negative_price_pattern(self) -> Pattern:
         """Get compiled negative price pattern."""
         return self.negative_price_pattern
@@ -136,13 +339,14 @@ class PatternConfig:
         """Get all compiled date section patterns."""
         return self.date_section_patterns
     
-    def get_invoice_number_exclusions(self) -> set:
+    def get_invoice_number_exclusions(self) -> FrozenSet[str]:
         """Get set of false positive words to exclude from invoice number extraction."""
         return self.invoice_number_exclusions
 
 
-# Global pattern config instance
-_patterns: Optional[PatternConfig] = None
+# Global pattern config instance, compiled at import so the first
+# extraction does not pay for it
+_patterns: Optional[PatternConfig] = PatternConfig()
 
 
 def get_patterns() -> PatternConfig:
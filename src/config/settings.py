@@ -4,14 +4,17 @@ Application settings and configuration.
 Centralizes all configurable values.
 """
 
+import operator
 import os
 from typing import Optional, Dict, Any
-from pathlib import Path
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Invoice directories already found valid by Settings.validate()
+_validated_dirs = set()
+
 
 class Settings:
     """
@@ -20,6 +23,16 @@ class Settings:
     Centralizes all configuration values.
     """
     
+    # Non-sensitive settings exported by to_dict(), in output order
+    _PUBLIC_KEYS = (
+        'invoices_dir', 'output_dir', 'combined_output_format', 'min_ocr_length',
+        'required_keywords_count', 'min_price_patterns', 'enable_caching', 'cache_ttl',
+        'cache_max_size', 'max_retries', 'retry_delay', 'log_level', 'use_structured_data',
+        'use_hybrid_extraction', 'enable_parallel_processing', 'max_workers', 'use_re2',
+        'use_regex_module',
+    )
+    _get_public_values = staticmethod(operator.attrgetter(*_PUBLIC_KEYS))
+    
     def __init__(self):
         """Initialize settings from environment and defaults."""
         # API Settings
@@ -30,6 +43,8 @@ class Settings:
         # Processing Settings
         self.invoices_dir = os.getenv('INVOICES_DIR', 'invoices')
         self.output_dir = os.getenv('OUTPUT_DIR', 'output')
+        # Combined output: 'json' (all_invoices.json) or 'jsonl' (all_invoices.jsonl)
+        self.combined_output_format = os.getenv('COMBINED_OUTPUT_FORMAT', 'json').lower()
         
         # Validation Settings
         self.min_ocr_length = int(os.getenv('MIN_OCR_LENGTH', '100'))
@@ -39,6 +54,7 @@ class Settings:
         # Performance Settings
         self.enable_caching = os.getenv('ENABLE_CACHING', 'true').lower() == 'true'
         self.cache_ttl = int(os.getenv('CACHE_TTL', '3600'))  # 1 hour
+        self.cache_max_size = int(os.getenv('CACHE_MAX_SIZE', '1024'))
         self.max_retries = int(os.getenv('MAX_RETRIES', '3'))
         self.retry_delay = float(os.getenv('RETRY_DELAY', '1.0'))
         
@@ -54,6 +70,10 @@ class Settings:
         self.use_hybrid_extraction = os.getenv('USE_HYBRID_EXTRACTION', 'true').lower() == 'true'
         self.enable_parallel_processing = os.getenv('ENABLE_PARALLEL_PROCESSING', 'false').lower() == 'true'
         self.max_workers = int(os.getenv('MAX_WORKERS', '4'))
+        # Compile extraction patterns with RE2 (requires google-re2)
+        self.use_re2 = os.getenv('USE_RE2', 'false').lower() == 'true'
+        # Compile keyword-led extraction patterns with the regex module (requires regex)
+        self.use_regex_module = os.getenv('USE_REGEX_MODULE', 'false').lower() == 'true'
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -66,10 +86,13 @@ class Settings:
         Returns:
             Configuration value
         """
-        keys = key.split('.')
-        value = self
+        if '.' not in key:
+            # Common case: a single attribute lookup, no split or hasattr
+            value = getattr(self, key, None)
+            return value if value is not None else default
         
-        for k in keys:
+        value = self
+        for k in key.split('.'):
             if hasattr(value, k):
                 value = getattr(value, k)
             else:
@@ -84,34 +107,25 @@ class Settings:
         Returns:
             True if valid, False otherwise
         """
-        if not all([self.veryfi_client_id, self.veryfi_username, self.veryfi_api_key]):
+        if not (self.veryfi_client_id and self.veryfi_username and self.veryfi_api_key):
             return False
         
         # Validate directories exist or can be created
-        invoices_path = Path(self.invoices_dir)
-        if not invoices_path.exists() and not invoices_path.parent.exists():
+        invoices_dir = self.invoices_dir
+        if invoices_dir in _validated_dirs:
+            return True
+        
+        parent_dir = os.path.dirname(os.path.normpath(invoices_dir)) or '.'
+        if not os.path.exists(invoices_dir) and not os.path.exists(parent_dir):
             return False
         
+        # Directories rarely disappear mid-run, so remember the positive result
+        _validated_dirs.add(invoices_dir)
         return True
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert settings to dictionary (excluding sensitive data)."""
-        return {
-            'invoices_dir': self.invoices_dir,
-            'output_dir': self.output_dir,
-            'min_ocr_length': self.min_ocr_length,
-            'required_keywords_count': self.required_keywords_count,
-            'min_price_patterns': self.min_price_patterns,
-            'enable_caching': self.enable_caching,
-            'cache_ttl': self.cache_ttl,
-            'max_retries': self.max_retries,
-            'retry_delay': self.retry_delay,
-            'log_level': self.log_level,
-            'use_structured_data': self.use_structured_data,
-            'use_hybrid_extraction': self.use_hybrid_extraction,
-            'enable_parallel_processing': self.enable_parallel_processing,
-            'max_workers': self.max_workers,
-        }
+        return dict(zip(self._PUBLIC_KEYS, self._get_public_values(self)))
 
 
 # Global settings instance
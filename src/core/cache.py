@@ -4,7 +4,10 @@ Caching utilities.
 Provides caching for expensive operations like regex compilation and API responses.
 """
 
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+import heapq
+import threading
 import time
 from ..config.settings import get_settings
 
@@ -15,18 +18,33 @@ class SimpleCache:
     """
     Simple in-memory cache with TTL support.
     
-    Thread-safe for basic use cases.
+    Bounded to maxsize entries with least-recently-used eviction. Expired
+    entries are dropped lazily on get() and in bulk on set() via a heap of
+    deadlines, so they do not pile up between lookups.
+    
+    Values are stored as live Python objects, so cache hits return
+    already-decoded data without any serialization round-trip.
+    
+    Thread-safe: a lock guards the entry map and expiry heap, which the
+    parallel document path reads and updates from worker threads.
     """
     
-    def __init__(self, ttl: Optional[int] = None):
+    def __init__(self, ttl: Optional[int] = None, maxsize: Optional[int] = None):
         """
         Initialize cache.
         
         Args:
             ttl: Time to live in seconds (None for no expiration)
+            maxsize: Maximum number of entries (defaults to settings.cache_max_size)
         """
-        self._cache: Dict[str, tuple[Any, float]] = {}
+        # key -> (value, expiry deadline in time.monotonic_ns(), or None),
+        # ordered from least to most recently used
+        self._cache: Dict[str, Tuple[Any, Optional[int]]] = OrderedDict()
+        # (deadline, key) min-heap; entries may be stale after re-set or eviction
+        self._expiry_heap: List[Tuple[int, str]] = []
         self.ttl = ttl or settings.cache_ttl
+        self.maxsize = maxsize or settings.cache_max_size
+        self._lock = threading.Lock()
     
     def get(self, key: str) -> Optional[Any]:
         """
@@ -38,17 +56,20 @@ class SimpleCache:
         Returns:
             Cached value or None if not found/expired
         """
-        if key not in self._cache:
-            return None
-        
-        value, timestamp = self._cache[key]
-        
-        # Check expiration
-        if self.ttl and (time.time() - timestamp) > self.ttl:
-            del self._cache[key]
-            return None
-        
-        return value
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            
+            value, expires_at = entry
+            
+            # Check expiration (monotonic, so unaffected by wall-clock changes)
+            if expires_at is not None and time.monotonic_ns() > expires_at:
+                del self._cache[key]
+                return None
+            
+            self._cache.move_to_end(key)
+            return value
     
     def set(self, key: str, value: Any):
         """
@@ -58,11 +79,46 @@ class SimpleCache:
             key: Cache key
             value: Value to cache
         """
-        self._cache[key] = (value, time.time())
+        with self._lock:
+            now = time.monotonic_ns()
+            self._purge_expired(now)
+            
+            expires_at = now + int(self.ttl * 1_000_000_000) if self.ttl else None
+            self._cache[key] = (value, expires_at)
+            self._cache.move_to_end(key)
+            if expires_at is not None:
+                heapq.heappush(self._expiry_heap, (expires_at, key))
+            
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+            
+            # Rebuild the heap if stale entries (re-set or evicted keys) dominate it
+            if len(self._expiry_heap) > 2 * self.maxsize:
+                self._expiry_heap = [
+                    (deadline, k) for k, (_, deadline) in self._cache.items() if deadline is not None
+                ]
+                heapq.heapify(self._expiry_heap)
+    
+    def _purge_expired(self, now: int):
+        """
+        Drop entries whose deadline has passed (caller holds the lock).
+        
+        Args:
+            now: Current time.monotonic_ns()
+        """
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            deadline, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Only drop the entry if this heap item is its current deadline
+            if entry is not None and entry[1] == deadline:
+                del self._cache[key]
     
     def clear(self):
         """Clear all cached values."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
+            self._expiry_heap.clear()
     
     def has(self, key: str) -> bool:
         """Check if key exists in cache (and is not expired)."""
@@ -71,12 +127,15 @@ class SimpleCache:
 
 # Global cache instance
 _cache: Optional[SimpleCache] = None
+_cache_lock = threading.Lock()
 
 
 def get_cache() -> SimpleCache:
     """Get the global cache instance."""
     global _cache
     if _cache is None:
-        _cache = SimpleCache()
+        with _cache_lock:
+            if _cache is None:
+                _cache = SimpleCache()
     return _cache
 
@@ -18,10 +18,9 @@ Example usage:
     validator: IValidator = MyValidator()
 """
 
-from typing import Protocol, Any, runtime_checkable
+from typing import Protocol, Any
 
 
-@runtime_checkable
 class IValidator(Protocol):
     """
     Protocol defining the contract for validator classes.
@@ -4,11 +4,64 @@ Centralized logging configuration.
 Eliminates duplication and provides consistent logging across the application.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
-from typing import Optional
+import time
+from typing import Dict, Optional
 from pathlib import Path
 
+# Loggers handed out by get_logger, keyed by name
+_loggers: Dict[str, logging.Logger] = {}
+
+# Background listener that formats and writes records queued by setup_logging
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Flush queued records, stop the background listener and close its handlers."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler writing through a 64 KiB buffer.
+    
+    The stock handler flushes after every record (one write() per line).
+    This one flushes on ERROR and above, or when flush_interval seconds have
+    passed since the last flush; close() flushes whatever remains.
+    """
+    
+    def __init__(self, filename: str, flush_interval: float = 1.0):
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        super().__init__(filename)
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=1 << 16,
+                    encoding=self.encoding, errors=getattr(self, 'errors', None))
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            now = time.monotonic()
+            if record.levelno >= logging.ERROR or now - self._last_flush >= self.flush_interval:
+                self.flush()
+                self._last_flush = now
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
 
 def setup_logging(
     level: str = 'INFO',
@@ -18,6 +71,12 @@ def setup_logging(
     """
     Configure logging for the entire application.
     
+    Log calls only enqueue the record; a QueueListener thread owns the
+    stream/file handlers, so formatting and I/O happen off the calling
+    (worker) threads. The log file is written through a buffer flushed
+    about once a second and on errors. Queued records are flushed at
+    interpreter exit.
+    
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         format_string: Custom format string (uses default if None)
@@ -29,20 +88,40 @@ def setup_logging(
     # Convert string level to logging constant
     log_level = getattr(logging, level.upper(), logging.INFO)
     
-    # Configure root logger
+    # Stop a listener from a previous call so its handlers are flushed and closed
+    _stop_listener()
+    
+    # Handlers that do the actual output, driven by the listener thread
+    formatter = logging.Formatter(format_string)
     handlers = [logging.StreamHandler(sys.stdout)]
     
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
-        handlers.append(logging.FileHandler(log_file))
+        handlers.append(_BufferedFileHandler(log_file))
+    
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    # The root logger only gets a QueueHandler. Its plain '%(message)s'
+    # formatter merges args and traceback into the record before it is queued;
+    # the listener's handlers apply the full format.
+    log_queue: queue.Queue = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
     
     logging.basicConfig(
         level=log_level,
-        format=format_string,
-        handlers=handlers,
+        handlers=[queue_handler],
         force=True  # Override any existing configuration
     )
+    
+    global _listener
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+atexit.register(_stop_listener)
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -55,7 +134,12 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Logger instance
     """
-    return logging.getLogger(name)
+    # logging.getLogger takes the module-level logging lock on every call;
+    # a plain dict lookup avoids that for repeated requests
+    logger = _loggers.get(name)
+    if logger is None:
+        logger = _loggers[name] = logging.getLogger(name)
+    return logger
 
 
 def configure_from_settings(settings) -> None:
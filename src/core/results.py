@@ -4,13 +4,17 @@ Result objects for functional error handling.
 Provides a clean way to handle success/failure without exceptions.
 """
 
+import sys
 from typing import Optional, Any, Generic, TypeVar
 from dataclasses import dataclass
 
 T = TypeVar('T')
 
+# Slotted dataclasses need Python 3.10+; older interpreters keep __dict__
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class Result(Generic[T]):
     """Base result class for operation outcomes."""
     
@@ -21,6 +25,8 @@ class Result(Generic[T]):
     @classmethod
     def success_result(cls, value: T) -> 'Result[T]':
         """Create a success result."""
+        if value is True and cls is Result:
+            return _SUCCESS_TRUE
         return cls(success=True, value=value)
     
     @classmethod
@@ -46,3 +52,6 @@ class Result(Generic[T]):
         """Get the error message."""
         return self.error
 
+
+# Results are immutable, so the common "succeeded" outcome can be shared
+_SUCCESS_TRUE = Result(success=True, value=True)
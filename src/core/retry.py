@@ -4,6 +4,8 @@ Retry logic and circuit breaker pattern.
 Provides robust error handling for API calls and external operations.
 """
 
+import random
+import threading
 import time
 from typing import Callable, Optional, Type, Tuple, Any
 from functools import wraps
@@ -12,7 +14,29 @@ from ..core.exceptions import APIError
 from ..core.logging_config import get_logger
 
 logger = get_logger(__name__)
-settings = get_settings()
+
+
+def _is_permanent_failure(error: Exception) -> bool:
+    """
+    Check if an error is a client-side API failure that retrying cannot fix.
+    
+    Reads the HTTP status from APIError.status_code, or from the .status
+    attribute carried by Veryfi SDK errors (veryfi.errors.VeryfiClientError).
+    
+    Args:
+        error: Exception raised by the wrapped call
+        
+    Returns:
+        True if the error has a 4xx status other than 408/429
+    """
+    if isinstance(error, APIError):
+        status_code = error.status_code
+    else:
+        status_code = getattr(error, 'status', None)
+    if not isinstance(status_code, int):
+        return False
+    # 408 (timeout) and 429 (rate limited) are worth retrying
+    return 400 <= status_code < 500 and status_code not in (408, 429)
 
 
 def retry(
@@ -25,42 +49,52 @@ def retry(
     """
     Retry decorator for functions that may fail.
     
+    Waits use exponential backoff with full jitter (a random fraction of the
+    current delay), so workers failing together do not retry in lockstep.
+    Errors with a 4xx status (other than 408/429), either APIErrors or Veryfi
+    SDK errors, are raised immediately.
+    
     Args:
-        max_attempts: Maximum number of retry attempts (default from settings)
-        delay: Initial delay between retries in seconds (default from settings)
+        max_attempts: Maximum number of retry attempts (default from settings at call time)
+        delay: Initial delay between retries in seconds (default from settings at call time)
         backoff: Multiplier for delay after each retry
         exceptions: Tuple of exception types to catch and retry
         on_retry: Optional callback function called on each retry
     """
-    max_attempts = max_attempts or settings.max_retries
-    delay = delay or settings.retry_delay
-    
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
-            current_delay = delay
+            # Resolved per call so settings changed after import take effect
+            current_settings = get_settings()
+            attempts = max_attempts or current_settings.max_retries
+            current_delay = delay or current_settings.retry_delay
             last_exception = None
             
-            for attempt in range(1, max_attempts + 1):
+            for attempt in range(1, attempts + 1):
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
                     last_exception = e
                     
-                    if attempt < max_attempts:
+                    if _is_permanent_failure(e):
+                        logger.error("Non-retryable failure for %s: %s", func.__name__, e)
+                        raise
+                    
+                    if attempt < attempts:
+                        sleep_for = random.uniform(0, current_delay)
                         logger.warning(
-                            f"Attempt {attempt}/{max_attempts} failed for {func.__name__}: {str(e)}. "
-                            f"Retrying in {current_delay}s..."
+                            "Attempt %d/%d failed for %s: %s. Retrying in %.2fs...",
+                            attempt, attempts, func.__name__, e, sleep_for
                         )
                         
                         if on_retry:
                             on_retry(attempt, e)
                         
-                        time.sleep(current_delay)
+                        time.sleep(sleep_for)
                         current_delay *= backoff
                     else:
                         logger.error(
-                            f"All {max_attempts} attempts failed for {func.__name__}: {str(e)}"
+                            "All %d attempts failed for %s: %s", attempts, func.__name__, e
                         )
             
             # All attempts failed, raise last exception
@@ -95,8 +129,9 @@ class CircuitBreaker:
         self.recovery_timeout = recovery_timeout
         self.expected_exception = expected_exception
         self.failure_count = 0
-        self.last_failure_time: Optional[float] = None
+        self.last_failure_time: Optional[float] = None  # time.monotonic()
         self.state = 'closed'  # closed, open, half_open
+        self._lock = threading.Lock()
     
     def call(self, func: Callable, *args, **kwargs) -> Any:
         """
@@ -114,39 +149,51 @@ class CircuitBreaker:
             CircuitBreakerOpenError: If circuit is open
             Exception: Original exception from function
         """
-        if self.state == 'open':
-            if time.time() - (self.last_failure_time or 0) > self.recovery_timeout:
-                self.state = 'half_open'
-                logger.info("Circuit breaker transitioning to half-open state")
-            else:
-                raise APIError("Circuit breaker is open - service unavailable")
+        # Fast path: a healthy circuit needs no lock and no writes on success
+        if self.state == 'closed' and self.failure_count == 0:
+            try:
+                return func(*args, **kwargs)
+            except self.expected_exception:
+                self._record_failure()
+                raise
+        
+        with self._lock:
+            if self.state == 'open':
+                if time.monotonic() - (self.last_failure_time or 0) > self.recovery_timeout:
+                    self.state = 'half_open'
+                    logger.info("Circuit breaker transitioning to half-open state")
+                else:
+                    raise APIError("Circuit breaker is open - service unavailable")
         
         try:
             result = func(*args, **kwargs)
-            
-            # Success - reset failure count
+        except self.expected_exception:
+            self._record_failure()
+            raise
+        
+        # Success - reset failure count
+        with self._lock:
             if self.state == 'half_open':
                 self.state = 'closed'
                 logger.info("Circuit breaker closed - service recovered")
             
             self.failure_count = 0
-            return result
-            
-        except self.expected_exception as e:
+        return result
+    
+    def _record_failure(self):
+        """Count a failure and open the circuit once the threshold is reached."""
+        with self._lock:
             self.failure_count += 1
-            self.last_failure_time = time.time()
+            self.last_failure_time = time.monotonic()
             
             if self.failure_count >= self.failure_threshold:
                 self.state = 'open'
-                logger.error(
-                    f"Circuit breaker opened after {self.failure_count} failures"
-                )
-            
-            raise
+                logger.error("Circuit breaker opened after %d failures", self.failure_count)
     
     def reset(self):
         """Reset circuit breaker to closed state."""
-        self.state = 'closed'
-        self.failure_count = 0
-        self.last_failure_time = None
+        with self._lock:
+            self.state = 'closed'
+            self.failure_count = 0
+            self.last_failure_time = None
 
@@ -7,10 +7,235 @@ Provides abstract base classes for all extractors.
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any
 from datetime import datetime
+import calendar
+import functools
 import re
 from ..config.patterns import get_patterns
 from ..core.logging_config import get_logger
 
+# Whole-string numeric date with one separator used twice, e.g. 01/15/2024 or 2024-01-15
+_NUMERIC_DATE_RE = re.compile(r'([0-9]{1,4})([/-])([0-9]{1,2})\2([0-9]{1,4})')
+
+# Textual-month dates, e.g. "January 15, 2024" or "15 Jan 2024"
+_MONTH_FIRST_DATE_RE = re.compile(r'([A-Za-z]+) ([0-9]{1,2}), ([0-9]{4})')
+_DAY_FIRST_DATE_RE = re.compile(r'([0-9]{1,2}) ([A-Za-z]+) ([0-9]{4})')
+
+# Lowercase full and abbreviated month names, as %B and %b accept them
+_MONTHS = {
+    name.lower(): number
+    for number in range(1, 13)
+    for name in (calendar.month_name[number], calendar.month_abbr[number])
+}
+
+# Digit runs, scanned once by the fallback for dates no strptime format accepts
+_DIGITS_RE = re.compile(r'\d+')
+
+# strptime formats tried in order; the numeric ones are only needed for
+# inputs _NUMERIC_DATE_RE does not cover (e.g. space-padded days)
+_DATE_FORMATS = (
+    '%m/%d/%Y', '%d/%m/%Y', '%Y/%m/%d',
+    '%m-%d-%Y', '%d-%m-%Y', '%Y-%m-%d',
+    '%B %d, %Y', '%b %d, %Y',
+    '%d %B %Y', '%d %b %Y',
+)
+_ALPHA_DATE_FORMATS = _DATE_FORMATS[6:]
+
+
+def _numeric_date(first: str, second: str, third: str) -> Optional[datetime]:
+    """
+    Resolve numeric date parts the way the numeric strptime formats would.
+    
+    Tries month/day/year, day/month/year, then year/month/day, accepting
+    the same tokens as %m (1-12), %d (1-31) and %Y (exactly four digits).
+    
+    Args:
+        first: First numeric part
+        second: Second numeric part
+        third: Third numeric part
+        
+    Returns:
+        Parsed datetime, or None if no interpretation is a valid date
+    """
+    def is_month(part):
+        return len(part) <= 2 and 1 <= int(part) <= 12
+    
+    def is_day(part):
+        return len(part) <= 2 and 1 <= int(part) <= 31
+    
+    candidates = []
+    if len(third) == 4:
+        if is_month(first) and is_day(second):
+            candidates.append((third, first, second))
+        if is_day(first) and is_month(second):
+            candidates.append((third, second, first))
+    if len(first) == 4 and is_month(second) and is_day(third):
+        candidates.append((first, second, third))
+    
+    for year, month, day in candidates:
+        try:
+            return datetime(int(year), int(month), int(day))
+        except ValueError:
+            continue
+    return None
+
+
+def _text_date(date_str: str) -> Optional[datetime]:
+    """
+    Resolve "Month DD, YYYY" and "DD Month YYYY" dates without strptime.
+    
+    Args:
+        date_str: Stripped date string
+        
+    Returns:
+        Parsed datetime, or None if the string is not one of these shapes
+        or not a valid date
+    """
+    match = _MONTH_FIRST_DATE_RE.fullmatch(date_str)
+    if match:
+        month_name, day, year = match.groups()
+    else:
+        match = _DAY_FIRST_DATE_RE.fullmatch(date_str)
+        if not match:
+            return None
+        day, month_name, year = match.groups()
+    
+    month = _MONTHS.get(month_name.lower())
+    if month is None:
+        return None
+    try:
+        return datetime(int(year), month, int(day))
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str) -> Optional[str]:
+    """
+    Parse a stripped date string into MM/DD/YYYY (see BaseExtractor._parse_date).
+    
+    Pure over its input, so repeated dates across a batch (invoice, due and
+    line-item dates) are parsed once. Clear with _parse_date_cached.cache_clear().
+    
+    Args:
+        date_str: Date string with surrounding whitespace removed
+        
+    Returns:
+        Date string in USA format (MM/DD/YYYY), or None if parsing fails
+    """
+    # Fast path: ISO dates (YYYY-MM-DD), the form structured responses use
+    if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-' and date_str.isascii():
+        year, month, day = date_str[:4], date_str[5:7], date_str[8:]
+        if year.isdigit() and month.isdigit() and day.isdigit():
+            try:
+                return datetime(int(year), int(month), int(day)).strftime('%m/%d/%Y')
+            except ValueError:
+                pass  # e.g. 2024-02-30; let the general path decide
+    
+    # Fast path: purely numeric dates resolve without strptime exceptions
+    formats = _DATE_FORMATS
+    numeric_match = _NUMERIC_DATE_RE.fullmatch(date_str)
+    if numeric_match:
+        dt = _numeric_date(*numeric_match.group(1, 3, 4))
+        if dt:
+            return dt.strftime('%m/%d/%Y')  # USA format: MM/DD/YYYY
+        # No numeric format can match; only the text formats remain
+        formats = _ALPHA_DATE_FORMATS
+    else:
+        dt = _text_date(date_str)
+        if dt:
+            return dt.strftime('%m/%d/%Y')  # USA format: MM/DD/YYYY
+    
+    # Try common formats
+    for fmt in formats:
+        try:
+            dt = datetime.strptime(date_str, fmt)
+            return dt.strftime('%m/%d/%Y')  # USA format: MM/DD/YYYY
+        except ValueError:
+            continue
+    
+    # Try to extract year-month-day from various patterns
+    digit_runs = _DIGITS_RE.findall(date_str)
+    
+    # Only worth trying when some run is long enough to hold a year
+    if any(len(run) >= 4 for run in digit_runs):
+        # Try to find month and day: each run read in 1-2 digit chunks
+        parts = [run[i:i + 2] for run in digit_runs for i in range(0, len(run), 2)]
+        if len(parts) >= 3:
+            try:
+                # Assume MM/DD/YYYY or DD/MM/YYYY
+                if len(parts[0]) == 4:  # YYYY/MM/DD
+                    dt = datetime(int(parts[0]), int(parts[1]), int(parts[2]))
+                else:  # MM/DD/YYYY or DD/MM/YYYY
+                    # Try both interpretations
+                    try:
+                        dt = datetime(int(parts[2]), int(parts[0]), int(parts[1]))
+                    except ValueError:
+                        dt = datetime(int(parts[2]), int(parts[1]), int(parts[0]))
+                return dt.strftime('%m/%d/%Y')  # USA format: MM/DD/YYYY
+            except (ValueError, IndexError):
+                pass
+    
+    return None
+
+
+# Domains that identify a well-known company, matched anywhere in the name
+_VENDOR_DOMAINS = {
+    'fb.com': 'Facebook, Inc.',
+    'facebook.com': 'Facebook, Inc.',
+    'google.com': 'Google LLC',
+    'amazon.com': 'Amazon.com, Inc.',
+    'apple.com': 'Apple Inc.',
+}
+_VENDOR_DOMAIN_RE = re.compile('|'.join(map(re.escape, _VENDOR_DOMAINS)), re.IGNORECASE)
+
+# Company suffixes (lowercased) and their standard spelling
+_VENDOR_SUFFIXES = {
+    'ltd.': 'Ltd.', 'ltd': 'Ltd.',
+    'inc.': 'Inc.', 'inc': 'Inc.',
+    'llc': 'LLC',
+    'corp.': 'Corp.', 'corp': 'Corp.',
+    'corporation': 'Corporation',
+    'company': 'Company',
+    'co.': 'Co.', 'co': 'Co.',
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_vendor_name_cached(vendor_name: str) -> str:
+    """
+    Clean a non-empty vendor name (see BaseExtractor._clean_vendor_name).
+    
+    Pure over its input, so names seen repeatedly across a batch are cleaned
+    once. Clear with _clean_vendor_name_cached.cache_clear().
+    
+    Args:
+        vendor_name: Raw vendor name string
+        
+    Returns:
+        Cleaned and normalized vendor name
+    """
+    # Common domain-to-company transformations (domains never contain
+    # whitespace, so the raw name can be searched before normalizing it)
+    domain_match = _VENDOR_DOMAIN_RE.search(vendor_name)
+    if domain_match:
+        return _VENDOR_DOMAINS[domain_match.group(0).lower()]
+    
+    # Strip and collapse whitespace in one pass
+    words = vendor_name.split()
+    
+    # Capitalize first letter of each word, but standardize company suffixes
+    # (existing suffixes are preserved, never added)
+    if words:
+        # Capitalize first word
+        words[0] = words[0].capitalize()
+        # Standardize suffixes (ltd → Ltd., inc → Inc.); capitalize other words
+        for i in range(1, len(words)):
+            words[i] = _VENDOR_SUFFIXES.get(words[i].lower()) or words[i].capitalize()
+    
+    cleaned = ' '.join(words)
+    
+    return cleaned
+
 
 class BaseExtractor(ABC):
     """
@@ -22,7 +247,15 @@ class BaseExtractor(ABC):
     def __init__(self):
         """Initialize base extractor with patterns."""
         self.patterns = get_patterns()
-        self.logger = get_logger(self.__class__.__name__)
+        
+        # One logger per concrete class, stored on that class (not inherited
+        # from a parent) so per-document construction skips the lookup
+        cls = type(self)
+        logger = cls.__dict__.get('_class_logger')
+        if logger is None:
+            logger = get_logger(cls.__name__)
+            cls._class_logger = logger
+        self.logger = logger
     
     @abstractmethod
     def extract_all_fields(
@@ -42,7 +275,8 @@ class BaseExtractor(ABC):
         """
         pass
     
-    def _parse_date(self, date_str: str) -> Optional[str]:
+    @staticmethod
+    def _parse_date(date_str: str) -> Optional[str]:
         """
         Parse a date string into USA format (MM/DD/YYYY).
         
@@ -67,48 +301,10 @@ class BaseExtractor(ABC):
         Returns:
             Date string in USA format (MM/DD/YYYY), or None if parsing fails
         """
-        date_str = date_str.strip()
-        
-        # Try common formats
-        formats = [
-            '%m/%d/%Y', '%d/%m/%Y', '%Y/%m/%d',
-            '%m-%d-%Y', '%d-%m-%Y', '%Y-%m-%d',
-            '%B %d, %Y', '%b %d, %Y',
-            '%d %B %Y', '%d %b %Y',
-        ]
-        
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(date_str, fmt)
-                return dt.strftime('%m/%d/%Y')  # USA format: MM/DD/YYYY
-            except ValueError:
-                continue
-        
-        # Try to extract year-month-day from various patterns
-        year_match = re.search(r'(\d{4})', date_str)
-        
-        if year_match:
-            year = year_match.group(1)
-            # Try to find month and day
-            parts = re.findall(r'\d{1,2}', date_str)
-            if len(parts) >= 3:
-                try:
-                    # Assume MM/DD/YYYY or DD/MM/YYYY
-                    if len(parts[0]) == 4:  # YYYY/MM/DD
-                        dt = datetime(int(parts[0]), int(parts[1]), int(parts[2]))
-                    else:  # MM/DD/YYYY or DD/MM/YYYY
-                        # Try both interpretations
-                        try:
-                            dt = datetime(int(parts[2]), int(parts[0]), int(parts[1]))
-                        except ValueError:
-                            dt = datetime(int(parts[2]), int(parts[1]), int(parts[0]))
-                    return dt.strftime('%m/%d/%Y')  # USA format: MM/DD/YYYY
-                except (ValueError, IndexError):
-                    pass
-        
-        return None
+        return _parse_date_cached(date_str.strip())
     
-    def _clean_vendor_name(self, vendor_name: str) -> str:
+    @staticmethod
+    def _clean_vendor_name(vendor_name: str) -> str:
         """
         Clean and normalize vendor name professionally.
         
@@ -137,70 +333,5 @@ class BaseExtractor(ABC):
         if not vendor_name:
             return ''
         
-        # Strip whitespace
-        cleaned = vendor_name.strip()
-        
-        # Remove extra whitespace
-        cleaned = ' '.join(cleaned.split())
-        
-        # Common domain-to-company transformations
-        domain_transformations = {
-            'fb.com': 'Facebook, Inc.',
-            'facebook.com': 'Facebook, Inc.',
-            'google.com': 'Google LLC',
-            'amazon.com': 'Amazon.com, Inc.',
-            'apple.com': 'Apple Inc.',
-        }
-        
-        cleaned_lower = cleaned.lower()
-        for domain, company_name in domain_transformations.items():
-            if domain in cleaned_lower:
-                return company_name
-        
-        # Ensure proper capitalization for company suffixes
-        # Preserve existing suffixes
-        suffix_patterns = [
-            r'\b(Ltd\.?|Inc\.?|LLC|Corp\.?|Corporation|Company|Co\.?)\b',
-        ]
-        
-        # Check if name already has a suffix
-        has_suffix = False
-        for pattern in suffix_patterns:
-            if re.search(pattern, cleaned, re.IGNORECASE):
-                has_suffix = True
-                break
-        
-        # If no suffix and name looks like it should have one, don't add it
-        # (we preserve what's there, just clean it)
-        
-        # Capitalize first letter of each word, but preserve existing capitalization
-        # for company suffixes
-        words = cleaned.split()
-        if words:
-            # Capitalize first word
-            words[0] = words[0].capitalize()
-            # Preserve suffix capitalization (Ltd., Inc., etc.)
-            for i in range(1, len(words)):
-                word_lower = words[i].lower()
-                if word_lower in ['ltd.', 'ltd', 'inc.', 'inc', 'llc', 'corp.', 'corp', 'corporation', 'company', 'co.', 'co']:
-                    # Keep suffix as-is or standardize
-                    if word_lower in ['ltd.', 'ltd']:
-                        words[i] = 'Ltd.'
-                    elif word_lower in ['inc.', 'inc']:
-                        words[i] = 'Inc.'
-                    elif word_lower == 'llc':
-                        words[i] = 'LLC'
-                    elif word_lower in ['corp.', 'corp']:
-                        words[i] = 'Corp.'
-                    elif word_lower == 'corporation':
-                        words[i] = 'Corporation'
-                    elif word_lower in ['company', 'co.', 'co']:
-                        words[i] = 'Company' if word_lower == 'company' else 'Co.'
-                else:
-                    # Capitalize other words
-                    words[i] = words[i].capitalize()
-        
-        cleaned = ' '.join(words)
-        
-        return cleaned
+        return _clean_vendor_name_cached(vendor_name)
 
@@ -4,7 +4,8 @@ Hybrid Extractor.
 Orchestrates extraction using structured data first, OCR text as fallback.
 """
 
-from typing import Dict, Optional, Any, List
+import re
+from typing import Dict, Optional, Any, List, Tuple
 from .base import BaseExtractor
 from .ocr_extractor import OCRExtractor
 from .structured_extractor import StructuredExtractor
@@ -17,6 +18,37 @@ from .improved_line_item_extractor import ImprovedLineItemExtractor
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Payment instructions heading, as matched by OCRExtractor's vendor patterns
+_PAYMENT_RE = re.compile(r'please\s+make\s+payments|make\s+payments\s+to', re.IGNORECASE)
+
+# Fields taken from structured data, falling back to OCR, in output order
+_FALLBACK_FIELDS = ('vendor_address', 'bill_to_name', 'invoice_number', 'date')
+
+_sub_extractors = None
+
+
+def _get_sub_extractors() -> Tuple[
+    OCRExtractor, StructuredExtractor, LineItemExtractor, ImprovedLineItemExtractor
+]:
+    """
+    Get the sub-extractors shared by every HybridExtractor.
+    
+    They hold no per-document state, so they are created once on first use
+    instead of once per HybridExtractor.
+    
+    Returns:
+        Tuple of (OCR, structured, line item, improved line item) extractors
+    """
+    global _sub_extractors
+    if _sub_extractors is None:
+        _sub_extractors = (
+            OCRExtractor(),
+            StructuredExtractor(),
+            LineItemExtractor(),
+            ImprovedLineItemExtractor(),
+        )
+    return _sub_extractors
+
 
 class HybridExtractor(BaseExtractor):
     """
@@ -28,10 +60,12 @@ class HybridExtractor(BaseExtractor):
     def __init__(self):
         """Initialize hybrid extractor with sub-extractors."""
         super().__init__()
-        self.ocr_extractor = OCRExtractor()
-        self.structured_extractor = StructuredExtractor()
-        self.line_item_extractor = LineItemExtractor()
-        self.improved_extractor = ImprovedLineItemExtractor()  # NEW
+        (
+            self.ocr_extractor,
+            self.structured_extractor,
+            self.line_item_extractor,
+            self.improved_extractor,
+        ) = _get_sub_extractors()
     
     def extract_all_fields(
         self,
@@ -60,7 +94,7 @@ class HybridExtractor(BaseExtractor):
         ocr_data = self._extract_ocr_data(ocr_text, structured_data)
         
         # Extract and improve line items
-        line_items = self._extract_and_improve_line_items(response, ocr_text, structured_data)
+        line_items = self._extract_and_improve_line_items(response, ocr_text, structured_data, ocr_data)
         
         # Combine fields with vendor name priority logic
         result = self._combine_extracted_fields(structured_data, ocr_data, line_items, ocr_text)
@@ -93,41 +127,44 @@ class HybridExtractor(BaseExtractor):
             structured_data: Already extracted structured data
             
         Returns:
-            Dictionary with extracted OCR data
+            Dictionary with extracted OCR data, including OCR line items;
+            empty if there is no OCR text or nothing from it would be used
         """
         if not ocr_text:
             return {}
         
-        ocr_data = self.ocr_extractor.extract_all_fields(ocr_text=ocr_text)
-        
-        # If no structured line items, use OCR line items
-        if not structured_data.get('line_items'):
-            ocr_data['line_items'] = self.line_item_extractor.extract_from_ocr(ocr_text)
+        # Structured data (line items included) wins wherever it has a value,
+        # so when it has every field the OCR pass would be discarded
+        if structured_data and all(structured_data.get(field) for field in ('vendor_name',) + _FALLBACK_FIELDS):
+            logger.debug("Structured data has every field; skipping OCR extraction")
+            return {}
         
-        return ocr_data
+        return self.ocr_extractor.extract_all_fields(ocr_text=ocr_text)
     
     def _extract_and_improve_line_items(
         self,
         response: Optional[Dict[str, Any]],
         ocr_text: Optional[str],
-        structured_data: Dict[str, Any]
+        structured_data: Dict[str, Any],
+        ocr_data: Dict[str, Any]
     ) -> List[Dict[str, Any]]:
         """
-        Extract and improve line items.
+        Pick the already extracted line items and improve them.
         
         Args:
             response: Veryfi API response
             ocr_text: OCR text
             structured_data: Structured data already extracted
+            ocr_data: OCR data already extracted
             
         Returns:
             List of improved line items
         """
-        # Extract line items
+        # Reuse the line items extracted above rather than parsing again
         if response and settings.use_structured_data:
-            line_items = self.line_item_extractor.extract_from_structured(response)
+            line_items = structured_data['line_items']
         elif ocr_text:
-            line_items = self.line_item_extractor.extract_from_ocr(ocr_text)
+            line_items = ocr_data['line_items']
         else:
             line_items = []
         
@@ -159,9 +196,14 @@ class HybridExtractor(BaseExtractor):
             Selected vendor name or None
         """
         # Priority 1: OCR "Please make payments to:" pattern (most reliable)
-        if ocr_text:
-            payment_vendor = self.ocr_extractor.extract_vendor_name(ocr_text)
-            if payment_vendor and self._has_payment_pattern(ocr_text):
+        # (check for the heading first; it is far cheaper than vendor extraction)
+        if ocr_text and self._has_payment_pattern(ocr_text):
+            # Reuse the OCR pass's vendor name when it ran on this text
+            if 'vendor_name' in ocr_data:
+                payment_vendor = ocr_data['vendor_name']
+            else:
+                payment_vendor = self.ocr_extractor.extract_vendor_name(ocr_text)
+            if payment_vendor:
                 logger.debug("Used vendor name from 'Please make payments to:' pattern in OCR")
                 return payment_vendor
         
@@ -169,7 +211,7 @@ class HybridExtractor(BaseExtractor):
         vendor_name = structured_data.get('vendor_name') or ocr_data.get('vendor_name')
         if vendor_name:
             source = "structured data" if structured_data.get('vendor_name') else "OCR text fallback"
-            logger.debug(f"Used {source} for vendor_name")
+            logger.debug("Used %s for vendor_name", source)
         
         return vendor_name
     
@@ -183,8 +225,7 @@ class HybridExtractor(BaseExtractor):
         Returns:
             True if payment pattern found
         """
-        lower = ocr_text.lower()
-        return 'please make payments' in lower or 'make payments to' in lower
+        return _PAYMENT_RE.search(ocr_text) is not None
     
     def _combine_extracted_fields(
         self,
@@ -205,14 +246,12 @@ class HybridExtractor(BaseExtractor):
         Returns:
             Combined result dictionary
         """
-        vendor_name = self._select_vendor_name(structured_data, ocr_data, ocr_text)
-        
-        return {
-            'vendor_name': vendor_name,
-            'vendor_address': structured_data.get('vendor_address') or ocr_data.get('vendor_address') or None,
-            'bill_to_name': structured_data.get('bill_to_name') or ocr_data.get('bill_to_name') or None,
-            'invoice_number': structured_data.get('invoice_number') or ocr_data.get('invoice_number') or None,
-            'date': structured_data.get('date') or ocr_data.get('date') or None,
-            'line_items': line_items
-        }
+        result = {'vendor_name': self._select_vendor_name(structured_data, ocr_data, ocr_text)}
+        
+        # Structured value first, then OCR; empty values become None
+        for field in _FALLBACK_FIELDS:
+            result[field] = structured_data.get(field) or ocr_data.get(field) or None
+        
+        result['line_items'] = line_items
+        return result
 
@@ -7,12 +7,317 @@ Handles:
 - Better number parsing
 """
 
+import functools
 import re
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, NamedTuple, Optional, Any, Tuple
 from ..core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Numeric codes in parentheses (3-12 digits), e.g. "(12345)"
+_SKU_RE = re.compile(r'\((\d{3,12})\)')
+
+# Dollar amounts such as "$1,234.56"
+_AMOUNT_RE = re.compile(r'\$?\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)')
+
+# Tax rate mentions in OCR text, tried in order
+_TAX_RATE_PATTERNS = (
+    re.compile(r'tax\s*:?\s*rate\s*:?\s*(\d+\.?\d*)\s*%', re.IGNORECASE),  # "Tax Rate: 8.5%"
+    re.compile(r'tax\s*:?\s*(\d+\.?\d*)\s*%', re.IGNORECASE),  # "Tax: 8.5%"
+    re.compile(r'(\d+\.?\d*)\s*%\s*tax', re.IGNORECASE),  # "8.5% tax"
+    re.compile(r'(\d+\.?\d*)\s*%\s*sales\s*tax', re.IGNORECASE),  # "8.5% sales tax"
+)
+
+# Line kind keywords, matched against lowercased text
+_DISCOUNT_KEYWORD_RE = re.compile(r'discount|credit|refund|deduction|adjustment')
+# "total" also covers "grand total" and "invoice total"
+_TOTAL_KEYWORD_RE = re.compile(r'total|amount due|balance due')
+
+# Description cleaning
+_PARENTHETICAL_RE = re.compile(r'\([^)]*\)')
+# "10 Gbps Fiber", "58 Gbps", "100 Mbps"; one scan covers all three forms
+_BANDWIDTH_RE = re.compile(r'(?P<gbps>\d+\s*Gbps)(?P<fiber>\s*Fiber)?|\d+\s*Mbps', re.IGNORECASE)
+# Technical codes: "to <code>", digit-led codes, and codes with digits inside;
+# only the "to" branch is case-insensitive, as when these were three subs
+_TECHNICAL_CODE_RE = re.compile(
+    r'\b(?i:to\s+[A-Za-z0-9]{6,15})\b'
+    r'|\b\d+[A-Za-z0-9]{5,14}\b'
+    r'|\b[A-Za-z]{2,}\d+[A-Za-z]{2,}\b'
+)
+_PIPE_RE = re.compile(r'\s*\|\s*')
+_DOUBLE_COMMA_RE = re.compile(r',\s*,')
+
+
+def _find_bandwidth_specs(text: str) -> List[str]:
+    """
+    Find bandwidth specifications in text with a single scan.
+    
+    Specs are ordered "Gbps Fiber" matches first, then every "Gbps" match
+    (including the speed part of "Gbps Fiber"), then "Mbps" matches.
+    
+    Args:
+        text: Text to scan
+        
+    Returns:
+        List of bandwidth specs, e.g. ["10 Gbps Fiber", "10 Gbps"]
+    """
+    fiber_specs, gbps_specs, mbps_specs = [], [], []
+    for match in _BANDWIDTH_RE.finditer(text):
+        if match.group('gbps'):
+            if match.group('fiber'):
+                fiber_specs.append(match.group(0))
+            gbps_specs.append(match.group('gbps'))
+        else:
+            mbps_specs.append(match.group(0))
+    return fiber_specs + gbps_specs + mbps_specs
+
+
+def _contains_word(text: str, phrase: str) -> bool:
+    """
+    Check if phrase appears in text as a whole word, ignoring case.
+    
+    A plain substring test rules out most phrases without building a regex;
+    the word-boundary regex only runs when the phrase is actually present.
+    
+    Args:
+        text: Text to search
+        phrase: Phrase to look for
+        
+    Returns:
+        True if phrase is found with a word boundary on both sides
+    """
+    if text.isascii() and phrase.lower() not in text.lower():
+        return False
+    return re.search(rf'\b{re.escape(phrase)}\b', text, re.IGNORECASE) is not None
+
+
+def _is_tax_description(description_lower: str) -> bool:
+    """Return True if a lowercased line item description names a tax item."""
+    # "tax" also covers "carrier tax(es)" and "sales tax"
+    return 'tax' in description_lower
+
+
+def _is_discount_description(description_lower: str, total: float) -> bool:
+    """Return True if a lowercased description or negative total marks a discount item."""
+    # The cheap sign check short-circuits before the description is scanned
+    return total < 0 or _DISCOUNT_KEYWORD_RE.search(description_lower) is not None
+
+
+def _normalize_commas(text: str) -> str:
+    """
+    Collapse double commas and drop a leading or trailing comma.
+    
+    Expects whitespace-normalized text (single spaces, stripped), so plain
+    string checks can stand in for the equivalent regexes and text without
+    any comma is returned untouched.
+    
+    Args:
+        text: Whitespace-normalized text
+        
+    Returns:
+        Text with comma separators cleaned up
+    """
+    if ',' not in text:
+        return text
+    
+    if ',,' in text or ', ,' in text:
+        text = _DOUBLE_COMMA_RE.sub(',', text)
+    if text.endswith(','):
+        text = text[:-1]
+    if text.startswith(','):
+        text = text[1:]
+    
+    return text.strip()
+
+
+@functools.lru_cache(maxsize=32)
+def _prepare_ocr_lines(ocr_text: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    Split OCR text into lines paired with their lowercased, stripped form.
+    
+    The total, subtotal and tax scans all read the same OCR text, so the
+    split and lowercasing are done once per text and shared between them.
+    
+    Args:
+        ocr_text: OCR text from invoice
+        
+    Returns:
+        Tuple of (raw_line, lower_stripped_line) pairs
+    """
+    return tuple((line, line.lower().strip()) for line in ocr_text.split('\n'))
+
+
+def _last_amount(line: str) -> Optional[float]:
+    """Return the last dollar amount on a line, or None if there is none."""
+    nums = _AMOUNT_RE.findall(line)
+    if not nums:
+        return None
+    try:
+        return float(nums[-1].replace(',', ''))
+    except ValueError:
+        return None
+
+
+class _OCRAmounts(NamedTuple):
+    """Invoice total, subtotal and tax amount found in OCR text (None if not found)."""
+    total: Optional[float]
+    subtotal: Optional[float]
+    tax: Optional[float]
+
+
+@functools.lru_cache(maxsize=32)
+def _scan_ocr_amounts(ocr_text: str) -> _OCRAmounts:
+    """
+    Find the invoice total, subtotal and tax amount in a single pass over OCR text.
+    
+    Each line is classified once and fills whichever of the three amounts it
+    matches first; the scan stops as soon as all three are known. The result
+    is cached per text, so it is returned as an immutable tuple.
+    
+    Args:
+        ocr_text: OCR text from invoice
+        
+    Returns:
+        _OCRAmounts with the total, subtotal and tax amounts
+    """
+    total = subtotal = tax = None
+    
+    for line, lower in _prepare_ocr_lines(ocr_text):
+        if 'subtotal' in lower:
+            # Subtotal line (but not "subtotal tax")
+            if subtotal is None and 'tax' not in lower:
+                subtotal = _last_amount(line)
+        else:
+            # Total keywords (but not "subtotal")
+            if total is None and _TOTAL_KEYWORD_RE.search(lower):
+                amount = _last_amount(line)
+                if amount is not None and amount > 0:
+                    total = amount
+            
+            # Tax amount (but exclude "carrier tax" line items and "%" rates)
+            if tax is None and 'tax' in lower and 'carrier' not in lower and '%' not in line:
+                amount = _last_amount(line)
+                if amount is not None and amount > 0:
+                    tax = amount
+        
+        if total is not None and subtotal is not None and tax is not None:
+            break
+    
+    return _OCRAmounts(total, subtotal, tax)
+
+
+@functools.lru_cache(maxsize=1024)
+def _clean_description_cached(description: str) -> str:
+    """
+    Clean a non-empty line item description (see
+    ImprovedLineItemExtractor._clean_line_item_description).
+    
+    Pure over its input, so descriptions repeated across line items (same
+    carrier, same circuit template) are cleaned once.
+    
+    Args:
+        description: Original description
+        
+    Returns:
+        Cleaned description, or empty string if nothing is left after cleaning
+    """
+    clean_desc = description
+    
+    # Step 1: Extract bandwidth/speed specifications from parenthetical content before removing it
+    # Patterns: "10 Gbps Fiber", "58 Gbps", "971 Gbps", "100 Mbps", etc.
+    bandwidth_specs = []
+    
+    # Find all parenthetical content
+    parenthetical_matches = _PARENTHETICAL_RE.finditer(description)
+    for match in parenthetical_matches:
+        paren_content = match.group(0)  # Includes parentheses
+        # Extract bandwidth specs from parenthetical content
+        # Pattern: digits followed by Gbps/Mbps, optionally followed by "Fiber"
+        for spec in _find_bandwidth_specs(paren_content):
+            spec = spec.strip()
+            if spec and spec not in bandwidth_specs:
+                bandwidth_specs.append(spec)
+    
+    # Also check for bandwidth specs outside parentheses (in case they're not in parentheses)
+    unparenthesized = clean_desc.replace('(', '').replace(')', '')
+    for spec in _find_bandwidth_specs(description):
+        spec = spec.strip()
+        # Only add if not already in the main description (avoid duplicates)
+        if spec and spec not in bandwidth_specs:
+            # Check if it's already in the description (not in parentheses)
+            if not _contains_word(unparenthesized, spec):
+                bandwidth_specs.append(spec)
+    
+    # Step 2: Remove all parenthetical codes (dates, SKUs, technical references)
+    # This includes patterns like (04/2023), (Intra-campus), (10/2023 Taxes), etc.
+    clean_desc = _PARENTHETICAL_RE.sub('', clean_desc)
+    
+    # Step 2: Remove technical codes (alphanumeric ID-like strings)
+    # Pattern: Technical codes that are clearly IDs, not real words
+    # Examples: "wXv21fam", "HOEpyb", "YDDTJOrnuW", "3XMOyFdB", "dHrINDY", "14AIFIIqmG"
+    # These typically:
+    # - Start with numbers or have numbers in the middle
+    # - Are 6-15 characters
+    # - Appear after "to" or at the end of phrases
+    # Remove, in one pass:
+    # - patterns like "to wXv21fam" or "Fiber to dHrINDY"
+    # - technical codes that start with numbers (like "14AIFIIqmG", "3XMOyFdB")
+    # - codes with numbers in the middle (like "wXv21fam")
+    clean_desc = _TECHNICAL_CODE_RE.sub('', clean_desc)
+    
+    # Step 3: Replace pipe separators (|) with commas for consistent formatting
+    # Handle both " | " and "|" patterns, normalize to ", "
+    clean_desc = _PIPE_RE.sub(', ', clean_desc)
+    
+    # Step 4: Normalize whitespace
+    # Replace multiple spaces with single space, remove leading/trailing whitespace
+    clean_desc = ' '.join(clean_desc.split()).strip()
+    
+    # Remove double, trailing and leading commas
+    clean_desc = _normalize_commas(clean_desc)
+    
+    # Step 5: Append extracted bandwidth specifications to the cleaned description
+    # Only add specs that aren't already in the cleaned description
+    for spec in bandwidth_specs:
+        # Check if spec is already in the cleaned description
+        if not _contains_word(clean_desc, spec):
+            if clean_desc:
+                clean_desc = f"{clean_desc}, {spec}"
+            else:
+                clean_desc = spec
+    
+    # Final cleanup: normalize whitespace again after adding specs
+    clean_desc = ' '.join(clean_desc.split()).strip()
+    if ',,' in clean_desc or ', ,' in clean_desc:
+        clean_desc = _DOUBLE_COMMA_RE.sub(',', clean_desc)  # Remove double commas again
+    
+    return clean_desc
+
+
+@functools.lru_cache(maxsize=1024)
+def _extract_sku_cached(description: str) -> str:
+    """
+    Extract the first numeric SKU from a non-empty description (see
+    ImprovedLineItemExtractor.extract_sku_from_description).
+    
+    Args:
+        description: Line item description text
+        
+    Returns:
+        Extracted SKU code or empty string if not found
+    """
+    # Numeric codes in parentheses (3-12 digits)
+    # Only matches numbers, no letters or special characters
+    for sku_match in _SKU_RE.finditer(description):
+        match = sku_match.group(1)
+        # The regex already guarantees 3-12 digits (no dates with / or -),
+        # so only years (1900-2100) remain to reject; see _is_valid_sku_code
+        if len(match) == 4 and 1900 <= int(match) <= 2100:
+            continue
+        return match
+    
+    return ''
+
 
 class ImprovedLineItemExtractor:
     """Enhanced line item extraction."""
@@ -49,18 +354,12 @@ class ImprovedLineItemExtractor:
         if not description:
             return ''
         
-        # Pattern to match numeric codes in parentheses (3-12 digits)
-        # Only matches numbers, no letters or special characters
-        pattern = r'\((\d{3,12})\)'
-        matches = re.findall(pattern, description)
-        
-        for match in matches:
-            if self._is_valid_sku_code(match):
-                logger.debug(f"Extracted numeric SKU '{match}' from description: {description[:50]}")
-                return match
-        
-        logger.debug(f"No valid numeric SKU found in description: {description[:50]}")
-        return ''
+        sku = _extract_sku_cached(description)
+        if sku:
+            logger.debug(f"Extracted numeric SKU '{sku}' from description: {description[:50]}")
+        else:
+            logger.debug(f"No valid numeric SKU found in description: {description[:50]}")
+        return sku
     
     def _is_valid_sku_code(self, code: str) -> bool:
         """
@@ -115,9 +414,7 @@ class ImprovedLineItemExtractor:
         Returns:
             True if item is a tax item, False otherwise
         """
-        description = item.get('description', '').lower()
-        tax_keywords = ['tax', 'carrier tax', 'carrier taxes', 'sales tax']
-        return any(keyword in description for keyword in tax_keywords)
+        return _is_tax_description(item.get('description', '').lower())
     
     def _is_discount_line_item(self, item: Dict[str, Any]) -> bool:
         """
@@ -129,10 +426,7 @@ class ImprovedLineItemExtractor:
         Returns:
             True if item is a discount item, False otherwise
         """
-        description = item.get('description', '').lower()
-        total = item.get('total', 0.0)
-        discount_keywords = ['discount', 'credit', 'refund', 'deduction', 'adjustment']
-        return any(keyword in description for keyword in discount_keywords) or total < 0
+        return _is_discount_description(item.get('description', '').lower(), item.get('total', 0.0))
     
     def _get_invoice_total(
         self,
@@ -207,32 +501,10 @@ class ImprovedLineItemExtractor:
         if not ocr_text:
             return None
         
-        lines = ocr_text.split('\n')
-        amount_pattern = r'\$?\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)'
-        total_keywords = ['total', 'grand total', 'invoice total', 'amount due', 'balance due']
-        
-        for line in lines:
-            lower = line.lower().strip()
-            # Look for total keywords (but not "subtotal")
-            if 'subtotal' in lower:
-                continue
-            
-            if not any(keyword in lower for keyword in total_keywords):
-                continue
-            
-            nums = re.findall(amount_pattern, line)
-            if not nums:
-                continue
-            
-            try:
-                total = float(nums[-1].replace(',', ''))
-                if total > 0:
-                    logger.debug(f"Found invoice total from OCR: {total}")
-                    return total
-            except (ValueError, IndexError):
-                pass
-        
-        return None
+        total = _scan_ocr_amounts(ocr_text).total
+        if total is not None:
+            logger.debug(f"Found invoice total from OCR: {total}")
+        return total
     
     def _calculate_invoice_total_from_line_items(self, line_items: Optional[List[Dict[str, Any]]]) -> Optional[float]:
         """
@@ -247,7 +519,7 @@ class ImprovedLineItemExtractor:
         if not line_items:
             return None
         
-        total = sum(item.get('total', 0.0) for item in line_items)
+        total = sum([item.get('total', 0.0) for item in line_items])
         if abs(total) > 0:
             logger.debug(f"Calculated invoice total from line items: {total}")
             return abs(total)  # Return absolute value as invoice total should be positive
@@ -305,7 +577,7 @@ class ImprovedLineItemExtractor:
             return None
         
         # Sum all tax line item totals (including negatives to get net tax)
-        total_tax = sum(item.get('total', 0.0) for item in tax_items)
+        total_tax = sum([item.get('total', 0.0) for item in tax_items])
         total_tax_abs = abs(total_tax)
         
         if total_tax_abs == 0:
@@ -406,15 +678,8 @@ class ImprovedLineItemExtractor:
         Returns:
             Tax rate as percentage, or None if not found
         """
-        tax_rate_patterns = [
-            r'tax\s*:?\s*rate\s*:?\s*(\d+\.?\d*)\s*%',  # "Tax Rate: 8.5%"
-            r'tax\s*:?\s*(\d+\.?\d*)\s*%',  # "Tax: 8.5%"
-            r'(\d+\.?\d*)\s*%\s*tax',  # "8.5% tax"
-            r'(\d+\.?\d*)\s*%\s*sales\s*tax',  # "8.5% sales tax"
-        ]
-        
-        for pattern in tax_rate_patterns:
-            match = re.search(pattern, ocr_text, re.IGNORECASE)
+        for pattern in _TAX_RATE_PATTERNS:
+            match = pattern.search(ocr_text)
             if match:
                 try:
                     rate = float(match.group(1))
@@ -436,11 +701,8 @@ class ImprovedLineItemExtractor:
         Returns:
             Tax rate as percentage, or None if calculation not possible
         """
-        lines = ocr_text.split('\n')
-        amount_pattern = r'\$?\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)'
-        
-        tax_amount = self._extract_tax_amount_from_ocr(lines, amount_pattern)
-        subtotal_amount = self._extract_subtotal_amount_from_ocr(lines, amount_pattern)
+        tax_amount = self._extract_tax_amount_from_ocr(ocr_text)
+        subtotal_amount = self._extract_subtotal_amount_from_ocr(ocr_text)
         
         # Calculate rate if both amounts found
         if subtotal_amount and subtotal_amount > 0 and tax_amount is not None and tax_amount >= 0:
@@ -451,72 +713,35 @@ class ImprovedLineItemExtractor:
         logger.debug(f"Could not calculate tax rate from OCR: tax={tax_amount}, subtotal={subtotal_amount}")
         return None
     
-    def _extract_subtotal_amount_from_ocr(self, lines: List[str], amount_pattern: str) -> Optional[float]:
+    def _extract_subtotal_amount_from_ocr(self, ocr_text: str) -> Optional[float]:
         """
-        Extract subtotal amount from OCR lines.
+        Extract subtotal amount from OCR text.
         
         Args:
-            lines: OCR text lines
-            amount_pattern: Regex pattern for amounts
+            ocr_text: OCR text from invoice
             
         Returns:
             Subtotal amount or None
         """
-        for line in lines:
-            lower = line.lower().strip()
-            
-            # Look for subtotal (but not "subtotal tax")
-            if 'subtotal' not in lower or 'tax' in lower:
-                continue
-            
-            nums = re.findall(amount_pattern, line)
-            if not nums:
-                continue
-            
-            try:
-                subtotal = float(nums[-1].replace(',', ''))
-                logger.debug(f"Found subtotal amount: {subtotal}")
-                return subtotal
-            except (ValueError, IndexError):
-                pass
-        
-        return None
+        subtotal = _scan_ocr_amounts(ocr_text).subtotal
+        if subtotal is not None:
+            logger.debug(f"Found subtotal amount: {subtotal}")
+        return subtotal
     
-    def _extract_tax_amount_from_ocr(self, lines: List[str], amount_pattern: str) -> Optional[float]:
+    def _extract_tax_amount_from_ocr(self, ocr_text: str) -> Optional[float]:
         """
-        Extract tax amount from OCR lines.
+        Extract tax amount from OCR text.
         
         Args:
-            lines: OCR text lines
-            amount_pattern: Regex pattern for amounts
+            ocr_text: OCR text from invoice
             
         Returns:
             Tax amount or None
         """
-        for line in lines:
-            lower = line.lower().strip()
-            
-            # Look for tax (but exclude "carrier tax" which is a line item)
-            if 'tax' not in lower or 'carrier' in lower or 'subtotal' in lower:
-                continue
-            
-            # Skip if line has percentage (it's a rate, not amount)
-            if '%' in line:
-                continue
-            
-            nums = re.findall(amount_pattern, line)
-            if not nums:
-                continue
-            
-            try:
-                tax_amount = float(nums[-1].replace(',', ''))
-                if tax_amount > 0:
-                    logger.debug(f"Found tax amount: {tax_amount}")
-                    return tax_amount
-            except (ValueError, IndexError):
-                pass
-        
-        return None
+        tax_amount = _scan_ocr_amounts(ocr_text).tax
+        if tax_amount is not None:
+            logger.debug(f"Found tax amount: {tax_amount}")
+        return tax_amount
     
     def extract_and_improve_line_items(
         self,
@@ -566,11 +791,13 @@ class ImprovedLineItemExtractor:
             Improved line item dictionary
         """
         description = item.get('description', '')
+        description_lower = (description or '').lower()
         existing_sku = item.get('sku', '')
+        total = item.get('total', 0.0)
         
         # Determine if this is a tax or discount item
-        is_tax = self._is_tax_line_item(item)
-        is_discount = self._is_discount_line_item(item)
+        is_tax = _is_tax_description(description_lower)
+        is_discount = _is_discount_description(description_lower, total)
         is_tax_or_discount = is_tax or is_discount
         
         # Extract SKU (only for regular products)
@@ -583,17 +810,17 @@ class ImprovedLineItemExtractor:
         item_tax_rate = self._determine_item_tax_rate(is_tax, is_discount, tax_rate, item_index)
         
         # Ensure price consistency with total
-        price = self._ensure_price_consistency(item.get('price', 0.0), item.get('total', 0.0), item_index)
-            
-            # Create improved item
+        price = self._ensure_price_consistency(item.get('price', 0.0), total, item_index)
+        
+        # Create improved item
         improved_item = {
-                'sku': sku,
-                'description': clean_desc,
-                'quantity': item.get('quantity', 0.0),
-                'price': price,
-                'tax_rate': item_tax_rate,
-                'total': item.get('total', 0.0)
-            }
+            'sku': sku,
+            'description': clean_desc,
+            'quantity': item.get('quantity', 0.0),
+            'price': price,
+            'tax_rate': item_tax_rate,
+            'total': total
+        }
         
         # Log improvements
         self._log_item_improvements(sku, existing_sku, description, item_index)
@@ -655,88 +882,7 @@ class ImprovedLineItemExtractor:
         if not description:
             return description
         
-        clean_desc = description
-        
-        # Step 1: Extract bandwidth/speed specifications from parenthetical content before removing it
-        # Patterns: "10 Gbps Fiber", "58 Gbps", "971 Gbps", "100 Mbps", etc.
-        bandwidth_specs = []
-        
-        # Find all parenthetical content
-        parenthetical_matches = re.finditer(r'\([^)]*\)', description)
-        for match in parenthetical_matches:
-            paren_content = match.group(0)  # Includes parentheses
-            # Extract bandwidth specs from parenthetical content
-            # Pattern: digits followed by Gbps/Mbps, optionally followed by "Fiber"
-            bandwidth_patterns = [
-                r'(\d+\s*Gbps\s*Fiber)',  # "10 Gbps Fiber"
-                r'(\d+\s*Gbps)',           # "58 Gbps", "971 Gbps"
-                r'(\d+\s*Mbps)',           # "100 Mbps"
-            ]
-            for pattern in bandwidth_patterns:
-                spec_matches = re.finditer(pattern, paren_content, re.IGNORECASE)
-                for spec_match in spec_matches:
-                    spec = spec_match.group(1).strip()
-                    if spec and spec not in bandwidth_specs:
-                        bandwidth_specs.append(spec)
-        
-        # Also check for bandwidth specs outside parentheses (in case they're not in parentheses)
-        for pattern in [r'(\d+\s*Gbps\s*Fiber)', r'(\d+\s*Gbps)', r'(\d+\s*Mbps)']:
-            all_specs = re.finditer(pattern, description, re.IGNORECASE)
-            for spec_match in all_specs:
-                spec = spec_match.group(1).strip()
-                # Only add if not already in the main description (avoid duplicates)
-                if spec and spec not in bandwidth_specs:
-                    # Check if it's already in the description (not in parentheses)
-                    spec_in_main = re.search(rf'\b{re.escape(spec)}\b', clean_desc.replace('(', '').replace(')', ''), re.IGNORECASE)
-                    if not spec_in_main:
-                        bandwidth_specs.append(spec)
-        
-        # Step 2: Remove all parenthetical codes (dates, SKUs, technical references)
-        # This includes patterns like (04/2023), (Intra-campus), (10/2023 Taxes), etc.
-        clean_desc = re.sub(r'\([^)]*\)', '', clean_desc)
-        
-        # Step 2: Remove technical codes (alphanumeric ID-like strings)
-        # Pattern: Technical codes that are clearly IDs, not real words
-        # Examples: "wXv21fam", "HOEpyb", "YDDTJOrnuW", "3XMOyFdB", "dHrINDY", "14AIFIIqmG"
-        # These typically:
-        # - Start with numbers or have numbers in the middle
-        # - Are 6-15 characters
-        # - Appear after "to" or at the end of phrases
-        # Remove patterns like "to wXv21fam" or "Fiber to dHrINDY"
-        clean_desc = re.sub(r'\bto\s+[A-Za-z0-9]{6,15}\b', '', clean_desc, flags=re.IGNORECASE)
-        # Remove technical codes that start with numbers (like "14AIFIIqmG", "3XMOyFdB")
-        clean_desc = re.sub(r'\b\d+[A-Za-z0-9]{5,14}\b', '', clean_desc)
-        # Remove codes with numbers in the middle (like "wXv21fam")
-        clean_desc = re.sub(r'\b[A-Za-z]{2,}\d+[A-Za-z]{2,}\b', '', clean_desc)
-        
-        # Step 3: Replace pipe separators (|) with commas for consistent formatting
-        # Handle both " | " and "|" patterns, normalize to ", "
-        clean_desc = re.sub(r'\s*\|\s*', ', ', clean_desc)
-        
-        # Step 4: Normalize whitespace
-        # Replace multiple spaces with single space, remove leading/trailing whitespace
-        clean_desc = ' '.join(clean_desc.split()).strip()
-        
-        # Remove trailing commas and clean up comma spacing
-        clean_desc = re.sub(r',\s*,', ',', clean_desc)  # Remove double commas
-        clean_desc = re.sub(r',\s*$', '', clean_desc)  # Remove trailing comma
-        clean_desc = re.sub(r'^\s*,\s*', '', clean_desc)  # Remove leading comma
-        clean_desc = clean_desc.strip()
-        
-        # Step 5: Append extracted bandwidth specifications to the cleaned description
-        # Only add specs that aren't already in the cleaned description
-        for spec in bandwidth_specs:
-            # Check if spec is already in the cleaned description
-            spec_normalized = re.escape(spec)
-            if not re.search(rf'\b{spec_normalized}\b', clean_desc, re.IGNORECASE):
-                if clean_desc:
-                    clean_desc = f"{clean_desc}, {spec}"
-                else:
-                    clean_desc = spec
-        
-        # Final cleanup: normalize whitespace again after adding specs
-        clean_desc = ' '.join(clean_desc.split()).strip()
-        clean_desc = re.sub(r',\s*,', ',', clean_desc)  # Remove double commas again
+        clean_desc = _clean_description_cached(description)
         
         # If description became empty after cleaning, use original
         if not clean_desc:
@@ -102,9 +102,10 @@ class LineItemExtractor(BaseExtractor):
             
             # Stop at totals section
             line_lower = line.lower()
-            totals_indicators = ['subtotal', 'tax', 'total', 'grand total', 'invoice total', 'amount due']
-            if any(indicator in line_lower and any(kw in line_lower for kw in [':', '=', '$']) 
-                   for indicator in totals_indicators):
+            # ('total' also covers "subtotal", "grand total" and "invoice total")
+            totals_indicators = ['tax', 'total', 'amount due']
+            if (any(indicator in line_lower for indicator in totals_indicators)
+                    and any(kw in line_lower for kw in [':', '=', '$'])):
                 if current_item and self._is_item_complete(current_item):
                     line_items.append(current_item)
                 break
@@ -188,16 +189,15 @@ class LineItemExtractor(BaseExtractor):
                     pass
         
         # Extract prices
-        price_matches = list(self.patterns.get_price_pattern().finditer(line))
+        price_matches = list(self.patterns.get_signed_price_pattern().finditer(line))
         price_values = []
         
         for match in price_matches:
-            price_str = match.group(1).replace(',', '')
+            price_str = match.group('amount').replace(',', '')
             try:
                 price_val = float(price_str)
-                # Check for negative
-                context_before = line[:match.start()].strip()
-                if context_before.endswith('-') or line[match.start():match.end()].startswith('-'):
+                # Check for negative (sign captured by the match, or a dash just before it)
+                if match.group('sign') == '-' or line[:match.start()].rstrip().endswith('-'):
                     price_val = -abs(price_val)
                 price_values.append(price_val)
             except ValueError:
@@ -214,9 +214,10 @@ class LineItemExtractor(BaseExtractor):
         # Description is the text part of the line
         description_parts = []
         
-        # Remove price patterns from line to get description
+        # Remove price patterns from line to get description (reusing the
+        # matches found above rather than scanning the line again)
         desc_line = line
-        for match in reversed(list(self.patterns.get_price_pattern().finditer(line))):
+        for match in reversed(price_matches):
             desc_line = desc_line[:match.start()] + desc_line[match.end():]
         
         # Remove quantity at start
@@ -231,7 +232,7 @@ class LineItemExtractor(BaseExtractor):
                 if part and len(part) > 3:
                     # Skip if it's just numbers or dates
                     if not (part.replace('.', '').replace(',', '').isdigit() or 
-                            re.match(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', part)):
+                            self.patterns.get_date_patterns()[0].match(part)):
                         description_parts.append(part)
         
         # Build description
@@ -292,7 +293,7 @@ class LineItemExtractor(BaseExtractor):
             if cleaned_item['description']:
                 cleaned.append(cleaned_item)
         
-        logger.info(f"Extracted {len(cleaned)} line items from OCR")
+        logger.info("Extracted %d line items from OCR", len(cleaned))
         return cleaned
     
     def extract_from_structured(self, response: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -357,6 +358,6 @@ class LineItemExtractor(BaseExtractor):
                     'total': total
                 })
         
-        logger.info(f"Extracted {len(line_items)} line items from structured data")
+        logger.info("Extracted %d line items from structured data", len(line_items))
         return line_items
 
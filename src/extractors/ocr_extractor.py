@@ -11,6 +11,18 @@ from ..core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Payment instructions naming the vendor, tried in order
+_PAYMENT_VENDOR_PATTERNS = (
+    re.compile(r'please\s+make\s+payments\s+to\s*:?\s*(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE),
+    re.compile(r'make\s+payments\s+to\s*:?\s*(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE),
+    re.compile(r'payments\s+should\s+be\s+made\s+to\s*:?\s*(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE),
+)
+_TRAILING_PUNCTUATION_RE = re.compile(r'[.,;]+$')
+
+# Street keywords, matched as substrings ('st' also covers "street",
+# 'ave' covers "avenue" and 'dr' covers "drive")
+_STREET_KEYWORDS = ('st', 'ave', 'road', 'rd', 'blvd', 'dr')
+
 
 class OCRExtractor(BaseExtractor):
     """
@@ -95,27 +107,21 @@ class OCRExtractor(BaseExtractor):
         Returns:
             Extracted vendor name or None
         """
-        payment_patterns = [
-            re.compile(r'please\s+make\s+payments\s+to\s*:?\s*(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE),
-            re.compile(r'make\s+payments\s+to\s*:?\s*(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE),
-            re.compile(r'payments\s+should\s+be\s+made\s+to\s*:?\s*(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE),
-        ]
-        
-        for pattern in payment_patterns:
+        for pattern in _PAYMENT_VENDOR_PATTERNS:
             match = pattern.search(ocr_text)
             if not match:
                 continue
             
             vendor_name = match.group(1).strip()
             # Clean up: remove any trailing punctuation or extra text
-            vendor_name = re.sub(r'[.,;]+$', '', vendor_name).strip()
+            vendor_name = _TRAILING_PUNCTUATION_RE.sub('', vendor_name).strip()
             
             if not vendor_name or len(vendor_name) <= 2:
                 continue
             
             cleaned = self._clean_vendor_name(vendor_name)
             if cleaned:
-                logger.debug(f"Extracted vendor name from payment pattern: {cleaned}")
+                logger.debug("Extracted vendor name from payment pattern: %s", cleaned)
                 return cleaned
         
         return None
@@ -131,8 +137,9 @@ class OCRExtractor(BaseExtractor):
             Extracted vendor name or None
         """
         lines = ocr_text.split('\n')
+        # Matched as substrings, so 'page' also covers "page 1", "page 2 of", ...
         false_positives = [
-            'page', 'page 1', 'page 2', 'page 1 of', 'page 2 of',
+            'page',
             'invoice', 'date', 'total', 'amount', 'due',
             'bill to', 'ship to', 'sold to', 'please make payments'
         ]
@@ -198,7 +205,11 @@ class OCRExtractor(BaseExtractor):
         Returns:
             Extracted vendor name or None
         """
-        for pattern in self.patterns.get_vendor_patterns():
+        if not self.patterns.get_vendor_combined().search(ocr_text):
+            return None
+        
+        patterns = self.patterns.candidate_patterns(self.patterns.get_vendor_patterns(), ocr_text)
+        for pattern in patterns:
             match = pattern.search(ocr_text)
             if not match:
                 continue
@@ -309,7 +320,7 @@ class OCRExtractor(BaseExtractor):
             # Check if we have a street (contains number and street keyword)
             has_street = any(
                 re.search(r'\d+', line) and 
-                any(keyword in line.lower() for keyword in ['street', 'st', 'ave', 'road', 'rd', 'blvd', 'drive', 'dr'])
+                any(keyword in line.lower() for keyword in _STREET_KEYWORDS)
                 for line in cleaned_lines
             )
             
@@ -355,12 +366,11 @@ class OCRExtractor(BaseExtractor):
         """
         address_lines = []
         # Enhanced stop keywords - stop before invoice metadata
+        # (substrings: 'account' also covers "account no", 'p.o.' covers "p.o. number")
         stop_keywords = [
             'invoice', 'date', 'bill to', 'ship to', 'item', 'description',
-            'account no', 'account number', 'p.o.', 'p.o. number', 'po number',
-            'services for month', 'services for', 'account', 'po-', 'account:'
+            'p.o.', 'po number', 'services for', 'account', 'po-'
         ]
-        address_keywords = ['street', 'st', 'avenue', 'ave', 'road', 'rd', 'blvd', 'drive', 'dr']
         
         for i in range(start_index, min(start_index + 15, len(lines))):
             line = lines[i].strip()
@@ -389,7 +399,7 @@ class OCRExtractor(BaseExtractor):
             # Check if line looks like an address line
             is_address_line = (
                 re.search(r'\d+', line) or
-                any(word in line_lower for word in address_keywords) or
+                any(word in line_lower for word in _STREET_KEYWORDS) or
                 re.search(r'\d{5}(?:-\d{4})?', line)  # ZIP code pattern
             )
             
@@ -446,7 +456,7 @@ class OCRExtractor(BaseExtractor):
                     continue
                 
                 # Skip lines that look like addresses (contain numbers at start, street keywords)
-                if re.match(r'^\d+', line) or any(keyword in line.lower() for keyword in ['street', 'st', 'ave', 'road', 'rd', 'blvd', 'drive', 'dr']):
+                if re.match(r'^\d+', line) or any(keyword in line.lower() for keyword in _STREET_KEYWORDS):
                     continue
                 
                 # Skip lines that look like metadata (account no, po number, etc.)
@@ -457,11 +467,15 @@ class OCRExtractor(BaseExtractor):
                 if re.match(r'^[A-Z][A-Za-z0-9\s&,.\-\']+$', line) and 3 <= len(line) <= 100:
                     cleaned_name = self._clean_company_name(line)
                     if cleaned_name:
-                        logger.debug(f"Found bill_to_name via section search: {cleaned_name}")
+                        logger.debug("Found bill_to_name via section search: %s", cleaned_name)
                         return cleaned_name
         
         # Strategy 2: Use pattern matching (fallback)
-        for pattern in self.patterns.get_bill_to_patterns():
+        if not self.patterns.get_bill_to_combined().search(ocr_text):
+            return None
+        
+        patterns = self.patterns.candidate_patterns(self.patterns.get_bill_to_patterns(), ocr_text)
+        for pattern in patterns:
             match = pattern.search(ocr_text)
             if match:
                 name = match.group(1).strip()
@@ -477,7 +491,7 @@ class OCRExtractor(BaseExtractor):
                     if not any(fp in name_lower for fp in false_positives):
                         cleaned_name = self._clean_company_name(name)
                         if cleaned_name:
-                            logger.debug(f"Found bill_to_name via pattern: {cleaned_name}")
+                            logger.debug("Found bill_to_name via pattern: %s", cleaned_name)
                             return cleaned_name
         
         return None
@@ -525,19 +539,20 @@ class OCRExtractor(BaseExtractor):
         
         # Strategy 1: Look for labeled invoice number in header area (first 30 lines)
         header_text = '\n'.join(lines[:30])
-        for pattern in self.patterns.get_invoice_number_patterns()[:3]:  # Try labeled patterns first
+        labeled_patterns = self.patterns.get_invoice_number_patterns()[:3]  # Try labeled patterns first
+        for pattern in self.patterns.candidate_patterns(labeled_patterns, header_text):
             matches = pattern.finditer(header_text)
             for match in matches:
                 invoice_num = match.group(1) if match.groups() else match.group(0)
                 invoice_num = invoice_num.strip() if invoice_num else None
                 
                 if invoice_num and self._is_valid_invoice_number(invoice_num, exclusions):
-                    logger.debug(f"Found invoice number via labeled pattern: {invoice_num}")
+                    logger.debug("Found invoice number via labeled pattern: %s", invoice_num)
                     return invoice_num
         
         # Strategy 2: Look for numeric invoice numbers (6-20 digits) in header area
         # These are often standalone numbers
-        numeric_pattern = re.compile(r'\b([0-9]{6,20})\b')
+        numeric_pattern = self.patterns.get_invoice_number_patterns()[2]  # Standalone 6-20 digits
         matches = numeric_pattern.finditer(header_text)
         candidates = []
         
@@ -551,7 +566,8 @@ class OCRExtractor(BaseExtractor):
                 context = header_text[context_start:context_end].lower()
                 
                 # If near invoice-related keywords, it's likely an invoice number
-                if any(keyword in context for keyword in ['invoice', 'inv', 'no.', 'number']):
+                # ('inv' also covers "invoice")
+                if any(keyword in context for keyword in ['inv', 'no.', 'number']):
                     candidates.append((match.start(), candidate))
         
         # Return the first valid candidate (usually the most likely one)
@@ -559,18 +575,22 @@ class OCRExtractor(BaseExtractor):
             # Sort by position (earlier in header is more likely)
             candidates.sort(key=lambda x: x[0])
             invoice_num = candidates[0][1]
-            logger.debug(f"Found invoice number via numeric pattern: {invoice_num}")
+            logger.debug("Found invoice number via numeric pattern: %s", invoice_num)
             return invoice_num
         
         # Strategy 3: Fallback to all patterns in full text
-        for pattern in self.patterns.get_invoice_number_patterns():
+        if not self.patterns.get_invoice_number_combined().search(ocr_text):
+            return None
+        
+        patterns = self.patterns.candidate_patterns(self.patterns.get_invoice_number_patterns(), ocr_text)
+        for pattern in patterns:
             matches = pattern.finditer(ocr_text)
             for match in matches:
                 invoice_num = match.group(1) if match.groups() else match.group(0)
                 invoice_num = invoice_num.strip() if invoice_num else None
                 
                 if invoice_num and self._is_valid_invoice_number(invoice_num, exclusions):
-                    logger.debug(f"Found invoice number via fallback pattern: {invoice_num}")
+                    logger.debug("Found invoice number via fallback pattern: %s", invoice_num)
                     return invoice_num
         
         return None
@@ -590,14 +610,13 @@ class OCRExtractor(BaseExtractor):
         if not invoice_num:
             return False
         
-        invoice_num_lower = invoice_num.lower().strip()
-        
         # Must be 6-20 characters (typical invoice number length)
         if len(invoice_num) < 6 or len(invoice_num) > 20:
             return False
         
-        # Exclude common false positives
-        if invoice_num_lower in exclusions:
+        # Exclude common false positives (all words, so numeric candidates,
+        # the common case, skip the lowercase copy)
+        if not invoice_num.isdigit() and invoice_num.lower().strip() in exclusions:
             return False
         
         # Exclude if it's all lowercase letters (likely a word, not invoice number)
@@ -605,7 +624,7 @@ class OCRExtractor(BaseExtractor):
             return False
         
         # Exclude if it looks like a date (contains / or - in date-like pattern)
-        if re.match(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', invoice_num):
+        if self.patterns.get_date_patterns()[0].match(invoice_num):
             return False
         
         # Exclude if it's a year (4 digits between 1900-2100)
@@ -639,7 +658,7 @@ class OCRExtractor(BaseExtractor):
         header_text = '\n'.join(lines[:30])
         
         # Try date section patterns first (most reliable)
-        for pattern in self.patterns.get_date_section_patterns():
+        for pattern in self.patterns.candidate_patterns(self.patterns.get_date_section_patterns(), header_text):
             match = pattern.search(header_text)
             if match:
                 date_str = match.group(1).strip()
@@ -650,12 +669,12 @@ class OCRExtractor(BaseExtractor):
                     if date_match:
                         parsed_date = self._parse_date(date_match.group(0))
                         if parsed_date and self._is_valid_date(parsed_date):
-                            logger.debug(f"Found date via labeled pattern: {parsed_date}")
+                            logger.debug("Found date via labeled pattern: %s", parsed_date)
                             return parsed_date
                 # Try parsing the whole string
                 parsed_date = self._parse_date(date_str)
                 if parsed_date and self._is_valid_date(parsed_date):
-                    logger.debug(f"Found date via labeled pattern (full string): {parsed_date}")
+                    logger.debug("Found date via labeled pattern (full string): %s", parsed_date)
                     return parsed_date
         
         # Strategy 2: Look for date patterns in header area (near invoice number or date labels)
@@ -684,17 +703,20 @@ class OCRExtractor(BaseExtractor):
         if date_candidates:
             date_candidates.sort(key=lambda x: (-x[0], x[1]))  # Sort by score (desc), then position
             best_date = date_candidates[0][2]
-            logger.debug(f"Found date via pattern matching: {best_date}")
+            logger.debug("Found date via pattern matching: %s", best_date)
             return best_date
         
         # Strategy 3: Search entire text for date patterns (fallback)
+        if not self.patterns.get_date_combined().search(ocr_text):
+            return None
+        
         for pattern in self.patterns.get_date_patterns():
             matches = pattern.finditer(ocr_text)
             for match in matches:
                 date_str = match.group(0)
                 parsed_date = self._parse_date(date_str)
                 if parsed_date and self._is_valid_date(parsed_date):
-                    logger.debug(f"Found date via fallback pattern: {parsed_date}")
+                    logger.debug("Found date via fallback pattern: %s", parsed_date)
                     return parsed_date
         
         return None
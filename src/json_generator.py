@@ -6,9 +6,14 @@ Converts extracted invoice data into properly formatted JSON output.
 
 import json
 import logging
+import os
 from datetime import datetime
 from typing import Dict, Any, List
-from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -99,6 +104,29 @@ class JSONGenerator:
         
         return json_output
     
+    @staticmethod
+    def serialize_json(data: Dict[str, Any], pretty: bool = True) -> bytes:
+        """
+        Serialize data to UTF-8 encoded JSON.
+        
+        Args:
+            data: Dictionary to serialize
+            pretty: If True, format JSON with indentation
+            
+        Returns:
+            JSON document as bytes
+        """
+        if orjson is not None:
+            # orjson emits UTF-8 bytes directly (equivalent to ensure_ascii=False)
+            options = orjson.OPT_NON_STR_KEYS
+            if pretty:
+                options |= orjson.OPT_INDENT_2
+            return orjson.dumps(data, option=options)
+        
+        if pretty:
+            return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        return json.dumps(data, ensure_ascii=False).encode('utf-8')
+    
     @staticmethod
     def save_json(data: Dict[str, Any], output_path: str, pretty: bool = True) -> None:
         """
@@ -109,15 +137,24 @@ class JSONGenerator:
             output_path: Path where JSON file should be saved
             pretty: If True, format JSON with indentation
         """
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+        JSONGenerator.save_json_bytes(JSONGenerator.serialize_json(data, pretty), output_path)
+    
+    @staticmethod
+    def save_json_bytes(json_bytes: bytes, output_path: str) -> None:
+        """
+        Save already-serialized JSON to a file.
+        
+        Args:
+            json_bytes: JSON document as produced by serialize_json
+            output_path: Path where JSON file should be saved
+        """
+        output_dir = os.path.dirname(output_path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
         
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                if pretty:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                else:
-                    json.dump(data, f, ensure_ascii=False)
+            with open(output_path, 'wb') as f:
+                f.write(json_bytes)
             
             logger.info(f"Saved JSON output to {output_path}")
         except Exception as e:
@@ -177,9 +214,149 @@ class JSONGenerator:
         return {
             'invoices': all_invoice_data,
             'total_invoices': len(all_invoice_data),
-            'metadata': {
-                'generated_at': datetime.now().isoformat(),
-                'version': '1.0'
-            }
+            'metadata': JSONGenerator._combined_metadata()
         }
+    
+    @staticmethod
+    def _combined_metadata() -> Dict[str, Any]:
+        """Build the metadata block of the combined JSON file."""
+        return {
+            'generated_at': datetime.now().isoformat(),
+            'version': '1.0'
+        }
+
 
+class CombinedJSONWriter:
+    """
+    Streams invoices into the combined JSON file as they are processed.
+    
+    Writes the same document as save_json(generate_combined_json(...)) without
+    keeping every invoice in memory: pretty-printed invoice documents are
+    re-indented and appended, and the totals/metadata are written on close.
+    The file is only created once the first invoice is added, and is removed
+    again if the batch exits with an exception.
+    """
+    
+    # Invoices sit two levels deep ({"invoices": [...]}), so their lines
+    # are shifted by four spaces
+    _INDENT = b'\n    '
+    
+    def __init__(self, output_path: str):
+        """
+        Initialize combined JSON writer.
+        
+        Args:
+            output_path: Path where the combined JSON file should be saved
+        """
+        self.output_path = output_path
+        self.count = 0
+        self._file = None
+    
+    def add(self, invoice_json: bytes) -> None:
+        """
+        Append an invoice to the combined file.
+        
+        Args:
+            invoice_json: Invoice JSON as produced by JSONGenerator.serialize_json(pretty=True)
+        """
+        if self._file is None:
+            output_dir = os.path.dirname(self.output_path)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+            self._file = open(self.output_path, 'wb')
+            self._file.write(b'{\n  "invoices": [')
+        else:
+            self._file.write(b',')
+        
+        self._file.write(self._INDENT + invoice_json.replace(b'\n', self._INDENT))
+        self.count += 1
+    
+    def close(self) -> None:
+        """Write the totals and metadata and close the file."""
+        if self._file is None:
+            return
+        
+        remaining = {
+            'total_invoices': self.count,
+            'metadata': JSONGenerator._combined_metadata()
+        }
+        # Drop the opening "{\n" of the remaining fields and close the invoices list
+        self._file.write(b'\n  ],\n' + JSONGenerator.serialize_json(remaining)[2:])
+        self._file.close()
+        self._file = None
+        logger.info(f"Saved JSON output to {self.output_path}")
+    
+    def abort(self) -> None:
+        """Close and remove a partially written file, leaving no combined output."""
+        if self._file is None:
+            return
+        
+        self._file.close()
+        self._file = None
+        try:
+            os.remove(self.output_path)
+        except OSError as e:
+            logger.warning(f"Could not remove partial output {self.output_path}: {e}")
+        else:
+            logger.warning(f"Discarded partial output {self.output_path} after an error")
+    
+    def __enter__(self) -> 'CombinedJSONWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # An aborted batch must not leave a complete-looking file with a truncated list
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+
+class JSONLinesWriter:
+    """
+    Streams invoices into a JSON Lines file, one compact document per line.
+    
+    Alternative to CombinedJSONWriter for consumers that read the combined
+    output line by line. The file is only created once the first invoice is added.
+    """
+    
+    def __init__(self, output_path: str):
+        """
+        Initialize JSON Lines writer.
+        
+        Args:
+            output_path: Path where the JSON Lines file should be saved
+        """
+        self.output_path = output_path
+        self.count = 0
+        self._file = None
+    
+    def add(self, invoice_json: bytes) -> None:
+        """
+        Append an invoice to the file.
+        
+        Args:
+            invoice_json: Invoice JSON as produced by JSONGenerator.serialize_json(pretty=False)
+        """
+        if self._file is None:
+            output_dir = os.path.dirname(self.output_path)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+            self._file = open(self.output_path, 'wb')
+        
+        self._file.write(invoice_json + b'\n')
+        self.count += 1
+    
+    def close(self) -> None:
+        """Close the file."""
+        if self._file is None:
+            return
+        
+        self._file.close()
+        self._file = None
+        logger.info(f"Saved JSON Lines output to {self.output_path}")
+    
+    def __enter__(self) -> 'JSONLinesWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
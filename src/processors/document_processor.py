@@ -5,12 +5,15 @@ Handles batch processing of PDF documents and file management.
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Any
 from pathlib import Path
 from ..clients.veryfi_client import VeryfiClient
 from ..core.logging_config import get_logger
+from ..config.settings import get_settings
 
 logger = get_logger(__name__)
+settings = get_settings()
 
 
 class DocumentProcessor:
@@ -67,11 +70,11 @@ class DocumentProcessor:
                     'ocr_text': ocr_text
                 }
             else:
-                logger.warning(f"Failed to get API response from {file_path}")
+                logger.warning("Failed to get API response from %s", file_path)
                 return None
                 
         except Exception as e:
-            logger.error(f"Error processing {file_path}: {str(e)}")
+            logger.error("Error processing %s: %s", file_path, e)
             return None
     
     def process_all_documents(self) -> List[Dict[str, Any]]:
@@ -84,18 +87,66 @@ class DocumentProcessor:
         pdf_files = self.get_pdf_files()
         results = []
         
-        for pdf_file in pdf_files:
-            logger.info(f"Processing: {pdf_file.name}")
-            result = self.process_single_document(pdf_file)
+        # Identical files (e.g. re-sent invoices) are only sent to the API once
+        file_keys = [self._content_key(pdf_file) for pdf_file in pdf_files]
+        unique_files: Dict[str, Path] = {}
+        for pdf_file, key in zip(pdf_files, file_keys):
+            unique_files.setdefault(key, pdf_file)
+        to_process = list(unique_files.values())
+        
+        if settings.enable_parallel_processing and settings.max_workers > 1 and len(to_process) > 1:
+            # API calls are network-bound, so worker threads overlap the round-trips.
+            # executor.map preserves input order, keeping output deterministic.
+            with ThreadPoolExecutor(max_workers=settings.max_workers) as executor:
+                processed = list(executor.map(self._process_with_logging, to_process))
+        else:
+            processed = [self._process_with_logging(pdf_file) for pdf_file in to_process]
+        
+        processed_by_key = dict(zip(unique_files, processed))
+        
+        for pdf_file, key in zip(pdf_files, file_keys):
+            result = processed_by_key[key]
+            if result and unique_files[key] != pdf_file:
+                logger.info("Reusing API response for duplicate file %s", pdf_file.name)
+                result = {**result, 'file_path': str(pdf_file), 'filename': pdf_file.name}
             
             if result:
                 results.append(result)
             else:
-                logger.warning(f"Skipping {pdf_file.name} due to processing error")
+                logger.warning("Skipping %s due to processing error", pdf_file.name)
         
         logger.info(f"Successfully processed {len(results)} out of {len(pdf_files)} documents")
         return results
     
+    def _content_key(self, pdf_file: Path) -> str:
+        """
+        Get a key identifying a document by its content.
+        
+        Args:
+            pdf_file: Path to the PDF file
+            
+        Returns:
+            Content hash, or the file path if the file cannot be read
+        """
+        try:
+            return VeryfiClient.get_file_hash(str(pdf_file))
+        except OSError:
+            # Unreadable files are processed individually and fail there
+            return str(pdf_file)
+    
+    def _process_with_logging(self, pdf_file: Path) -> Optional[Dict[str, Any]]:
+        """
+        Log and process a single document (used by sequential and parallel paths).
+        
+        Args:
+            pdf_file: Path to the PDF file
+            
+        Returns:
+            Processing result dictionary, or None if processing fails
+        """
+        logger.info("Processing: %s", pdf_file.name)
+        return self.process_single_document(pdf_file)
+    
     def process_document_by_path(self, file_path: str) -> Optional[Dict[str, Any]]:
         """
         Process a specific document by file path.
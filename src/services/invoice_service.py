@@ -4,6 +4,7 @@ Invoice Service.
 Orchestrates invoice processing business logic.
 """
 
+import logging
 from typing import Dict, Optional, Any
 from pathlib import Path
 from ..extractors.hybrid_extractor import HybridExtractor
@@ -123,7 +124,7 @@ class InvoiceService:
             error_msg = f"Failed to process invoice: {str(e)}"
             if filename:
                 error_msg += f" (file: {filename})"
-            logger.error(error_msg, exc_info=True)
+            logger.error(error_msg, exc_info=logger.isEnabledFor(logging.DEBUG))
             return Result.failure_result(error_msg)
     
     def save_invoice(
@@ -146,6 +147,28 @@ class InvoiceService:
             return Result.success_result(True)
         except Exception as e:
             error_msg = f"Failed to save invoice to {output_path}: {str(e)}"
-            logger.error(error_msg, exc_info=True)
+            logger.error(error_msg, exc_info=logger.isEnabledFor(logging.DEBUG))
+            return Result.failure_result(error_msg)
+    
+    def save_invoice_json(
+        self,
+        invoice_json: bytes,
+        output_path: str
+    ) -> Result[bool]:
+        """
+        Save already-serialized invoice JSON to a file.
+        
+        Args:
+            invoice_json: Invoice JSON as produced by JSONGenerator.serialize_json
+            output_path: Path to save JSON file
+            
+        Returns:
+            Result indicating success or failure
+        """
+        try:
+            self.json_generator.save_json_bytes(invoice_json, output_path)
+            return Result.success_result(True)
+        except Exception as e:
+            error_msg = f"Failed to save invoice to {output_path}: {str(e)}"
+            logger.error(error_msg, exc_info=logger.isEnabledFor(logging.DEBUG))
             return Result.failure_result(error_msg)
-
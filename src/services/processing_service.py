@@ -4,15 +4,19 @@ Processing Service.
 Orchestrates batch processing of multiple invoices.
 """
 
+import logging
+import os
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 from ..processors.document_processor import DocumentProcessor
 from ..services.invoice_service import InvoiceService
-from ..json_generator import JSONGenerator
+from ..json_generator import JSONGenerator, CombinedJSONWriter, JSONLinesWriter
 from ..core.logging_config import get_logger
 from ..core.results import Result
+from ..config.settings import get_settings
 
 logger = get_logger(__name__)
+settings = get_settings()
 
 
 class ProcessingService:
@@ -40,6 +44,22 @@ class ProcessingService:
         self.invoice_service = invoice_service or InvoiceService()
         self.json_generator = json_generator or JSONGenerator()
     
+    @staticmethod
+    def _output_path(output_dir: str, filename: str) -> str:
+        """
+        Build the JSON output path for a source file.
+        
+        Uses os.path string operations since this runs once per invoice.
+        
+        Args:
+            output_dir: Output directory for JSON
+            filename: Source PDF filename
+            
+        Returns:
+            Path of the JSON file (source stem with a .json extension)
+        """
+        return os.path.join(output_dir, os.path.splitext(filename)[0] + '.json')
+    
     def process_single_file(
         self,
         file_path: str,
@@ -99,10 +119,10 @@ class ProcessingService:
             invoice_data = invoice_result.get_value()
             
             # Save JSON
-            output_path = Path(output_dir) / f"{Path(filename).stem}.json"
+            output_path = self._output_path(output_dir, filename)
             save_result = self.invoice_service.save_invoice(
                 invoice_data,
-                str(output_path)
+                output_path
             )
             
             if save_result.is_failure():
@@ -133,28 +153,40 @@ class ProcessingService:
             Dictionary with processing summary
         """
         try:
-            if not self.processor:
-                self.processor = DocumentProcessor(invoices_dir)
-                
-                # Process all documents
-                logger.info(f"Processing all invoices from {invoices_dir}")
-                results = self.processor.process_all_documents()
-                
-                if not results:
-                    logger.warning("No documents were successfully processed")
-                    return {
-                        'total': 0,
-                        'successful': 0,
-                        'failed': 0,
-                        'excluded': 0
-                    }
-                
-                # Process each document
-                all_invoice_data = []
-                successful = 0
-                failed = 0
-                excluded = 0
-                
+            # Each batch reads its own directory, so a processor left over from
+            # an earlier call (batch or single file) is replaced rather than reused
+            self.processor = DocumentProcessor(invoices_dir)
+            
+            # Process all documents
+            logger.info(f"Processing all invoices from {invoices_dir}")
+            results = self.processor.process_all_documents()
+            
+            if not results:
+                logger.warning("No documents were successfully processed")
+                return {
+                    'total': 0,
+                    'successful': 0,
+                    'failed': 0,
+                    'excluded': 0
+                }
+            
+            # Normalize the output directory once for the whole batch
+            output_dir = os.fspath(output_dir)
+            os.makedirs(output_dir, exist_ok=True)
+            
+            # Process each document
+            successful = 0
+            failed = 0
+            excluded = 0
+            
+            # Stream successful invoices into the combined output file
+            jsonl_output = settings.combined_output_format == 'jsonl'
+            if jsonl_output:
+                combined_writer = JSONLinesWriter(os.path.join(output_dir, "all_invoices.jsonl"))
+            else:
+                combined_writer = CombinedJSONWriter(os.path.join(output_dir, "all_invoices.json"))
+            
+            with combined_writer:
                 for result in results:
                     filename = result['filename']
                     response = result.get('response')
@@ -172,61 +204,67 @@ class ProcessingService:
                             error = invoice_result.get_error()
                             if "does not match expected invoice format" in (error or ""):
                                 excluded += 1
-                                logger.info(f"✗ Excluded {filename} (format validation failed)")
+                                logger.info("✗ Excluded %s (format validation failed)", filename)
                             else:
                                 failed += 1
-                                logger.warning(f"✗ Failed to process {filename}: {error}")
+                                logger.warning("✗ Failed to process %s: %s", filename, error)
                             continue
                         
                         invoice_data = invoice_result.get_value()
                         
+                        # Serialize once; the bytes are reused for the combined file
+                        invoice_json = self.json_generator.serialize_json(invoice_data)
+                        
                         # Save individual JSON file
-                        output_path = Path(output_dir) / f"{Path(filename).stem}.json"
-                        save_result = self.invoice_service.save_invoice(
-                            invoice_data,
-                            str(output_path)
+                        output_path = self._output_path(output_dir, filename)
+                        save_result = self.invoice_service.save_invoice_json(
+                            invoice_json,
+                            output_path
                         )
                         
                         if save_result.is_failure():
                             error = save_result.get_error()
-                            logger.error(f"✗ Failed to save {filename}: {error}")
+                            logger.error("✗ Failed to save %s: %s", filename, error)
                             failed += 1
                             continue
                         
-                        all_invoice_data.append(invoice_data)
+                        if jsonl_output:
+                            combined_writer.add(
+                                self.json_generator.serialize_json(invoice_data, pretty=False)
+                            )
+                        else:
+                            combined_writer.add(invoice_json)
                         successful += 1
-                        logger.info(f"✓ Successfully processed {filename}")
+                        logger.info("✓ Successfully processed %s", filename)
                         
                     except Exception as e:
-                        logger.error(f"✗ Unexpected error processing {filename}: {str(e)}", exc_info=True)
+                        # Traceback only at DEBUG level; the message already names the file
+                        logger.error(
+                            "✗ Unexpected error processing %s: %s", filename, e,
+                            exc_info=logger.isEnabledFor(logging.DEBUG)
+                        )
                         failed += 1
-                
-                # Save combined JSON file
-                if all_invoice_data:
-                    combined_data = self.json_generator.generate_combined_json(all_invoice_data)
-                    combined_output_path = Path(output_dir) / "all_invoices.json"
-                    self.json_generator.save_json(combined_data, str(combined_output_path))
-                
-                summary = {
-                    'total': len(results),
-                    'successful': successful,
-                    'failed': failed,
-                    'excluded': excluded,
-                    'output_dir': output_dir
-                }
-                
-                # Print summary
-                print("\n" + "="*60)
-                print("Processing Summary")
-                print("="*60)
-                print(f"Total documents: {summary['total']}")
-                print(f"Successfully processed: {summary['successful']}")
-                print(f"Failed: {summary['failed']}")
-                print(f"Excluded (wrong format): {summary['excluded']}")
-                print(f"Output directory: {summary['output_dir']}")
-                print("="*60)
-                
-                return summary
+            
+            summary = {
+                'total': len(results),
+                'successful': successful,
+                'failed': failed,
+                'excluded': excluded,
+                'output_dir': output_dir
+            }
+            
+            # Print summary
+            print("\n" + "="*60)
+            print("Processing Summary")
+            print("="*60)
+            print(f"Total documents: {summary['total']}")
+            print(f"Successfully processed: {summary['successful']}")
+            print(f"Failed: {summary['failed']}")
+            print(f"Excluded (wrong format): {summary['excluded']}")
+            print(f"Output directory: {summary['output_dir']}")
+            print("="*60)
+            
+            return summary
                 
         except Exception as e:
             logger.error(f"Error in batch processing: {str(e)}", exc_info=True)
@@ -5,6 +5,7 @@ Validates that documents match the expected invoice format.
 """
 
 import re
+from itertools import islice
 from typing import Optional, Any
 from ..config.settings import get_settings
 from ..config.patterns import get_patterns
@@ -51,11 +52,12 @@ class FormatValidator(IValidator):
         Returns:
             True if the document matches expected invoice format, False otherwise
         """
-        # Check for key invoice indicators
+        # Check for key invoice indicators (lowercase the text once, not per keyword)
         required_keywords = ['invoice', 'total', 'date']
+        ocr_text_lower = ocr_text.lower()
         found_keywords_list = [
             keyword for keyword in required_keywords 
-            if keyword.lower() in ocr_text.lower()
+            if keyword in ocr_text_lower
         ]
         found_keywords = len(found_keywords_list)
         
@@ -70,12 +72,15 @@ class FormatValidator(IValidator):
             )
             return False
         
-        # Check for price patterns (invoices should have prices)
-        price_matches = self.patterns.get_price_pattern().findall(ocr_text)
+        # Check for price patterns (invoices should have prices); stop scanning
+        # as soon as enough matches are found
         min_price_patterns = self.settings.min_price_patterns
-        if len(price_matches) < min_price_patterns:
+        price_count = sum(1 for _ in islice(
+            self.patterns.get_price_pattern().finditer(ocr_text), min_price_patterns
+        ))
+        if price_count < min_price_patterns:
             logger.info(
-                f"Format validation failed: Found only {len(price_matches)} price patterns "
+                f"Format validation failed: Found only {price_count} price patterns "
                 f"(need {min_price_patterns})"
             )
             return False
@@ -91,7 +96,7 @@ class FormatValidator(IValidator):
         
         logger.debug(
             f"Format validation passed: {found_keywords} keywords found, "
-            f"{len(price_matches)} price patterns, {len(ocr_text)} characters"
+            f"at least {price_count} price patterns, {len(ocr_text)} characters"
         )
         return True
 
@@ -1,16 +1,18 @@
 """
 Tests for core infrastructure components.
 
-Tests cache, circuit breaker, and retry logic.
+Tests cache, circuit breaker, retry logic, and pattern compilation.
 """
 
 import pytest
+import re
 import time
 from unittest.mock import Mock, patch
 from src.core.cache import SimpleCache, get_cache
 from src.core.retry import retry, CircuitBreaker
 from src.core.results import Result
 from src.core.exceptions import APIError
+from src.config.patterns import PatternConfig, re2, regex
 
 
 class TestSimpleCache:
@@ -51,6 +53,34 @@ class TestSimpleCache:
         assert cache.has('key1') is True
         assert cache.has('key2') is False
     
+    def test_cache_evicts_least_recently_used(self):
+        """Test that the cache stays bounded and evicts the LRU entry."""
+        cache = SimpleCache(maxsize=2)
+        cache.set('key1', 'value1')
+        cache.set('key2', 'value2')
+        cache.get('key1')  # key2 is now least recently used
+        
+        cache.set('key3', 'value3')
+        assert cache.get('key2') is None
+        assert cache.get('key1') == 'value1'
+        assert cache.get('key3') == 'value3'
+    
+    def test_cache_concurrent_access(self):
+        """Test concurrent set/get keeps the cache bounded and consistent."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        cache = SimpleCache(maxsize=8)
+        
+        def worker(n):
+            for i in range(500):
+                cache.set(f'key{(n * 7 + i) % 32}', i)
+                cache.get(f'key{i % 32}')
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(worker, range(4)))
+        
+        assert len(cache._cache) <= 8
+    
     def test_get_cache_singleton(self):
         """Test get_cache returns singleton."""
         cache1 = get_cache()
@@ -59,6 +89,50 @@ class TestSimpleCache:
         assert cache1 is cache2
 
 
+class TestFileHash:
+    """Test content hashing used for response cache keys."""
+    
+    def test_file_hash_reused_until_file_changes(self, tmp_path):
+        """Test that unchanged files are not re-read and changed files are."""
+        from src.clients.veryfi_client import VeryfiClient
+        
+        pdf = tmp_path / "invoice.pdf"
+        pdf.write_bytes(b"%PDF-1.4 first")
+        first = VeryfiClient.get_file_hash(str(pdf))
+        
+        with patch('builtins.open', side_effect=AssertionError("file re-read")):
+            assert VeryfiClient.get_file_hash(str(pdf)) == first
+        
+        pdf.write_bytes(b"%PDF-1.4 second version")
+        assert VeryfiClient.get_file_hash(str(pdf)) != first
+
+
+class TestBufferedFileHandler:
+    """Test buffered log file output."""
+    
+    def test_flushes_on_error_and_close(self, tmp_path):
+        """Test records are buffered until an error or close."""
+        import logging
+        from src.core.logging_config import _BufferedFileHandler
+        
+        log_file = tmp_path / "app.log"
+        handler = _BufferedFileHandler(str(log_file), flush_interval=60)
+        handler.setFormatter(logging.Formatter('%(levelname)s %(message)s'))
+        
+        def record(level, msg):
+            return logging.LogRecord('test', level, __file__, 1, msg, None, None)
+        
+        handler.handle(record(logging.INFO, 'first'))
+        assert log_file.read_text() == ''
+        
+        handler.handle(record(logging.ERROR, 'failed'))
+        assert log_file.read_text() == 'INFO first\nERROR failed\n'
+        
+        handler.handle(record(logging.INFO, 'last'))
+        handler.close()
+        assert log_file.read_text().endswith('INFO last\n')
+
+
 class TestCircuitBreaker:
     """Test CircuitBreaker functionality."""
     
@@ -97,7 +171,7 @@ class TestCircuitBreaker:
         """Test circuit breaker blocks calls when open."""
         breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
         breaker.state = 'open'
-        breaker.last_failure_time = time.time()
+        breaker.last_failure_time = time.monotonic()
         
         def func():
             return "should not execute"
@@ -110,7 +184,7 @@ class TestCircuitBreaker:
         """Test circuit breaker recovery after timeout."""
         breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=1)
         breaker.state = 'open'
-        breaker.last_failure_time = time.time() - 2  # 2 seconds ago
+        breaker.last_failure_time = time.monotonic() - 2  # 2 seconds ago
         
         def success_func():
             return "success"
@@ -169,6 +243,48 @@ class TestRetry:
         with pytest.raises(Exception) as exc_info:
             always_fail()
         assert "Always fails" in str(exc_info.value)
+    
+    def test_retry_does_not_retry_client_errors(self):
+        """Test that 4xx API errors are raised without retrying."""
+        attempt_count = [0]
+        
+        @retry(max_attempts=3, delay=0.1)
+        def bad_request():
+            attempt_count[0] += 1
+            raise APIError("Bad request", status_code=400)
+        
+        with pytest.raises(APIError):
+            bad_request()
+        assert attempt_count[0] == 1
+    
+    def test_retry_does_not_retry_veryfi_client_errors(self):
+        """Test that Veryfi SDK 4xx errors are raised without retrying."""
+        from veryfi.errors import BadRequest
+        attempt_count = [0]
+        
+        @retry(max_attempts=3, delay=0.1)
+        def bad_request():
+            attempt_count[0] += 1
+            raise BadRequest(Mock(status_code=400), error="Bad request")
+        
+        with pytest.raises(BadRequest):
+            bad_request()
+        assert attempt_count[0] == 1
+    
+    def test_retry_resolves_settings_at_call_time(self):
+        """Test that default attempts come from settings when called."""
+        attempt_count = [0]
+        
+        @retry(delay=0.01)
+        def always_fail():
+            attempt_count[0] += 1
+            raise Exception("Always fails")
+        
+        mock_settings = Mock(max_retries=2, retry_delay=0.01)
+        with patch('src.core.retry.get_settings', return_value=mock_settings):
+            with pytest.raises(Exception):
+                always_fail()
+        assert attempt_count[0] == 2
 
 
 class TestResult:
@@ -191,4 +307,106 @@ class TestResult:
         
         with pytest.raises(ValueError):
             result.get_value()
+    
+    def test_result_is_immutable(self):
+        """Test results cannot be modified after creation."""
+        result = Result.success_result(True)
+        
+        assert result == Result(success=True, value=True)
+        with pytest.raises(AttributeError):
+            result.value = False
+
 
+SAMPLE_INVOICE_TEXT = """Acme Supplies Inc.
+123 Main Street
+Springfield, IL 62704
+Invoice No. 20240115
+Invoice Date: Jan 15, 2024
+Bill To: Globex Corporation
+Customer: Globex
+SKU: AB-1234 Widget (PX-900) 2 $1,250.00
+Discount -$25.00
+Tax 8.25%
+"""
+
+
+class TestPatternConfig:
+    """Test pattern compilation engines."""
+    
+    def test_re_engine_by_default(self):
+        """Test that patterns use re when RE2 is disabled."""
+        patterns = PatternConfig(use_re2=False, use_regex_module=False)
+        
+        assert not patterns.use_re2
+        assert patterns.get_price_pattern().search('$1,250.00').group(1) == '1,250.00'
+    
+    def test_instances_share_compiled_patterns(self):
+        """Test that identical pattern sources compile to one shared object."""
+        first = PatternConfig(use_re2=False, use_regex_module=False)
+        second = PatternConfig(use_re2=False, use_regex_module=False)
+        
+        assert first.get_price_pattern() is second.get_price_pattern()
+        assert first.get_bill_to_combined() is second.get_bill_to_combined()
+    
+    def test_combined_matches_when_any_pattern_matches(self):
+        """Test that combined alternations agree with their pattern lists."""
+        patterns = PatternConfig(use_re2=False, use_regex_module=False)
+        samples = [SAMPLE_INVOICE_TEXT, "no labels here", "vendor: Acme\nbill to\nGlobex"]
+        
+        for patterns_list, combined in [
+            (patterns.get_invoice_number_patterns(), patterns.get_invoice_number_combined()),
+            (patterns.get_date_patterns(), patterns.get_date_combined()),
+            (patterns.get_sku_patterns(), patterns.get_sku_combined()),
+            (patterns.get_vendor_patterns(), patterns.get_vendor_combined()),
+            (patterns.get_bill_to_patterns(), patterns.get_bill_to_combined()),
+            (patterns.get_date_section_patterns(), patterns.get_date_section_combined()),
+        ]:
+            for text in samples:
+                expected = any(p.search(text) for p in patterns_list)
+                assert bool(combined.search(text)) == expected
+    
+    def test_candidate_patterns_skip_missing_keywords(self):
+        """Test that keyword prefiltering drops only patterns that cannot match."""
+        patterns = PatternConfig(use_re2=False, use_regex_module=False)
+        bill_to = patterns.get_bill_to_patterns()
+        
+        assert patterns.candidate_patterns(bill_to, "SOLD TO: Globex") == [bill_to[2]]
+        assert patterns.candidate_patterns(bill_to, "Bill To\nCustomer: Globex") == \
+            [bill_to[0], bill_to[1], bill_to[3]]
+        # Non-ASCII text is not prefiltered
+        assert patterns.candidate_patterns(bill_to, "Société Générale") == bill_to
+    
+    @pytest.mark.skipif(re2 is None, reason="google-re2 not installed")
+    def test_re2_matches_re(self):
+        """Test that RE2-compiled patterns find the same spans as re."""
+        re_patterns = PatternConfig(use_re2=False, use_regex_module=False)
+        re2_patterns = PatternConfig(use_re2=True)
+        
+        for name in PatternConfig.__slots__:
+            value = getattr(re_patterns, name)
+            if not isinstance(value, list):
+                value = [value]
+            other = getattr(re2_patterns, name)
+            if not isinstance(other, list):
+                other = [other]
+            for expected, actual in zip(value, other):
+                if not hasattr(expected, 'finditer'):
+                    continue
+                expected_spans = [m.span() for m in expected.finditer(SAMPLE_INVOICE_TEXT)]
+                actual_spans = [m.span() for m in actual.finditer(SAMPLE_INVOICE_TEXT)]
+                assert actual_spans == expected_spans, name
+    
+    @pytest.mark.skipif(regex is None, reason="regex not installed")
+    def test_regex_module_matches_re(self):
+        """Test that keyword-led patterns compiled with regex find the same spans as re."""
+        re_patterns = PatternConfig(use_re2=False, use_regex_module=False)
+        regex_patterns = PatternConfig(use_re2=False, use_regex_module=True)
+        
+        assert not isinstance(regex_patterns.get_bill_to_patterns()[0], re.Pattern)
+        for expected, actual in zip(
+            re_patterns.get_bill_to_patterns() + re_patterns.get_invoice_number_patterns(),
+            regex_patterns.get_bill_to_patterns() + regex_patterns.get_invoice_number_patterns(),
+        ):
+            expected_spans = [m.span() for m in expected.finditer(SAMPLE_INVOICE_TEXT)]
+            actual_spans = [m.span() for m in actual.finditer(SAMPLE_INVOICE_TEXT)]
+            assert actual_spans == expected_spans
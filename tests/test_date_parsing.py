@@ -68,4 +68,31 @@ class TestDateParsing:
         date = self.extractor.extract_date(ocr_text)
         # Should return None if not found
         assert date is None or isinstance(date, str)
-
+    
+    def test_parse_date_numeric_formats(self):
+        """Test numeric dates resolve in strptime format order."""
+        assert self.extractor._parse_date("01/15/2024") == "01/15/2024"
+        assert self.extractor._parse_date("15-01-2024") == "01/15/2024"
+        assert self.extractor._parse_date("2024-01-15") == "01/15/2024"
+        # Ambiguous: month/day wins over day/month
+        assert self.extractor._parse_date("02/03/2024") == "02/03/2024"
+        # Invalid as month/day (Feb 30) and day/month (month 30)
+        assert self.extractor._parse_date("02/30/2024") is None
+        # Space-padded day is still handled by strptime
+        assert self.extractor._parse_date("01/ 5/2024") == "01/05/2024"
+    
+    def test_parse_date_iso_format(self):
+        """Test ISO dates from structured responses."""
+        assert self.extractor._parse_date("2024-12-31") == "12/31/2024"
+        assert self.extractor._parse_date(" 2024-02-29 ") == "02/29/2024"
+        # Not a real day; the general path rejects it too
+        assert self.extractor._parse_date("2023-02-29") is None
+    
+    def test_parse_date_text_formats(self):
+        """Test month-name dates in both orders."""
+        assert self.extractor._parse_date("January 15, 2024") == "01/15/2024"
+        assert self.extractor._parse_date("sep 5, 2024") == "09/05/2024"
+        assert self.extractor._parse_date("15 March 2024") == "03/15/2024"
+        assert self.extractor._parse_date("1 Dec 2024") == "12/01/2024"
+        # Impossible day
+        assert self.extractor._parse_date("February 30, 2024") is None
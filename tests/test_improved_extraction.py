@@ -506,6 +506,20 @@ class TestImprovedLineItemExtractor:
         total = self.extractor._get_invoice_total(ocr_text=ocr_text)
         assert total == 10850.0
     
+    def test_ocr_amounts_found_in_single_scan(self):
+        """Test that total, subtotal and tax come from the same OCR scan."""
+        ocr_text = """
+        Carrier Tax: $12.00
+        Subtotal: $10,000.00
+        Subtotal Tax: $5.00
+        Tax (8.5%): $850.00
+        Tax: $850.00
+        Total: $10,850.00
+        """
+        assert self.extractor._get_invoice_total_from_ocr(ocr_text) == 10850.0
+        assert self.extractor._extract_subtotal_amount_from_ocr(ocr_text) == 10000.0
+        assert self.extractor._extract_tax_amount_from_ocr(ocr_text) == 850.0
+    
     def test_get_invoice_total_from_line_items(self):
         """Test calculating invoice total from line items."""
         line_items = [
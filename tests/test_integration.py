@@ -8,7 +8,7 @@ from pathlib import Path
 from src.processors import DocumentProcessor
 from src.extractors.hybrid_extractor import HybridExtractor
 from src.validators.format_validator import FormatValidator
-from src.json_generator import JSONGenerator
+from src.json_generator import JSONGenerator, CombinedJSONWriter
 
 
 class TestIntegration:
@@ -122,6 +122,58 @@ class TestIntegration:
         is_valid = self.json_gen.validate_json_structure(invalid_data)
         assert is_valid is False
     
+    def test_save_json_round_trip(self, tmp_path):
+        """Test saved JSON can be read back unchanged, including non-ASCII text."""
+        data = {
+            'vendor_name': 'Café Vendor',
+            'line_items': [{'sku': '12345', 'total': 10.5}]
+        }
+        output_path = tmp_path / 'nested' / 'invoice.json'
+        
+        self.json_gen.save_json(data, str(output_path))
+        
+        content = output_path.read_text(encoding='utf-8')
+        assert 'Café Vendor' in content
+        assert json.loads(content) == data
+    
+    def test_combined_json_writer_matches_full_serialization(self, tmp_path):
+        """Test streamed combined JSON equals serializing the combined structure."""
+        invoices = [
+            {'vendor_name': 'A', 'line_items': [{'sku': '1', 'total': 2.5}]},
+            {'vendor_name': 'B', 'line_items': []}
+        ]
+        output_path = tmp_path / 'all_invoices.json'
+        
+        with CombinedJSONWriter(str(output_path)) as writer:
+            for invoice in invoices:
+                writer.add(self.json_gen.serialize_json(invoice))
+        
+        combined = output_path.read_bytes()
+        parsed = json.loads(combined)
+        assert parsed['invoices'] == invoices
+        assert parsed['total_invoices'] == 2
+        assert combined == self.json_gen.serialize_json(parsed)
+    
+    def test_combined_json_writer_without_invoices(self, tmp_path):
+        """Test no combined file is created when nothing was added."""
+        output_path = tmp_path / 'all_invoices.json'
+        
+        with CombinedJSONWriter(str(output_path)):
+            pass
+        
+        assert not output_path.exists()
+    
+    def test_combined_json_writer_discards_partial_file_on_error(self, tmp_path):
+        """Test an exception mid-batch leaves no truncated combined file."""
+        output_path = tmp_path / 'all_invoices.json'
+        
+        with pytest.raises(RuntimeError):
+            with CombinedJSONWriter(str(output_path)) as writer:
+                writer.add(self.json_gen.serialize_json({'vendor_name': 'A'}))
+                raise RuntimeError("batch aborted")
+        
+        assert not output_path.exists()
+    
     def test_exclusion_logic(self):
         """Test document exclusion logic."""
         # Valid invoice (has invoice keyword, date, total, and price)
@@ -67,6 +67,14 @@ class TestOCROnlyExtraction:
         assert vendor_name is not None
         assert 'SWITCH' in vendor_name.upper() or 'TECHNOLOGIES' in vendor_name.upper()
     
+    def test_clean_vendor_address_drops_account_number_line(self):
+        """Test that account number metadata is not kept in the vendor address."""
+        address = "123 Main Street\nAccount Number: 998877\nSpringfield, IL 62704"
+        cleaned = self.extractor._clean_vendor_address(address)
+        assert 'Account Number' not in cleaned
+        assert '998877' not in cleaned
+        assert '123 Main Street' in cleaned
+    
     def test_extract_invoice_number_from_ocr_only(self):
         """Test invoice number extraction from OCR text only."""
         ocr_text = """
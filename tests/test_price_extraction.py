@@ -83,4 +83,16 @@ class TestPriceExtraction:
         import re
         tax_match = re.search(r'(\d+\.?\d*)\s*%', ocr_text)
         assert tax_match is not None
-
+    
+    def test_signed_price_pattern_matches_price_pattern(self):
+        """Test signed price pattern finds the same spans and captures the sign."""
+        patterns = self.extractor.patterns
+        line = "Discount -$25.00   Widget $1,250.00   Credit +5.00"
+        
+        signed = list(patterns.get_signed_price_pattern().finditer(line))
+        plain = list(patterns.get_price_pattern().finditer(line))
+        
+        assert [m.span() for m in signed] == [m.span() for m in plain]
+        assert [(m.group('sign'), m.group('amount')) for m in signed] == [
+            ('-', '25.00'), (None, '1,250.00'), ('+', '5.00')
+        ]
@@ -4,11 +4,13 @@ Tests for service layer components.
 Tests InvoiceService and ProcessingService business logic.
 """
 
+import json
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 from src.services.invoice_service import InvoiceService
 from src.services.processing_service import ProcessingService
+from src.processors.document_processor import DocumentProcessor
 from src.extractors.hybrid_extractor import HybridExtractor
 from src.validators.format_validator import FormatValidator
 from src.validators.data_validator import DataValidator
@@ -123,4 +125,131 @@ class TestProcessingService:
         
         assert result.is_failure()
         assert "Failed to process" in result.get_error()
+    
+    @patch('src.services.processing_service.DocumentProcessor')
+    def test_process_all_invoices_writes_outputs(self, mock_processor_class, tmp_path):
+        """Test batch processing writes per-invoice and combined JSON files."""
+        ocr_text = """
+        ACME CORPORATION
+        123 Main Street
+        Invoice #: INV-001
+        Date: 01/15/2024
+        Bill To: Customer Inc.
+        Item Description Qty Price Total
+        SKU-001 Product A 10 $5.00 $50.00
+        Subtotal: $50.00
+        Tax: $4.00
+        Total: $54.00
+        """
+        mock_processor = Mock()
+        mock_processor.process_all_documents.return_value = [
+            {'filename': 'first.pdf', 'response': {}, 'ocr_text': ocr_text},
+            {'filename': 'second.pdf', 'response': {}, 'ocr_text': 'Just random text'},
+        ]
+        mock_processor_class.return_value = mock_processor
+        
+        summary = ProcessingService().process_all_invoices('invoices', str(tmp_path))
+        
+        assert summary['successful'] == 1
+        assert summary['excluded'] == 1
+        first = json.loads((tmp_path / 'first.json').read_text())
+        combined = json.loads((tmp_path / 'all_invoices.json').read_text())
+        assert combined['total_invoices'] == 1
+        assert combined['invoices'] == [first]
+    
+    @patch('src.services.processing_service.settings')
+    @patch('src.services.processing_service.DocumentProcessor')
+    def test_process_all_invoices_writes_json_lines(
+        self, mock_processor_class, mock_settings, tmp_path
+    ):
+        """Test batch processing writes all_invoices.jsonl when configured."""
+        mock_settings.combined_output_format = 'jsonl'
+        ocr_text = """
+        ACME CORPORATION
+        Invoice #: INV-001
+        Date: 01/15/2024
+        Total: $100.00
+        """
+        mock_processor = Mock()
+        mock_processor.process_all_documents.return_value = [
+            {'filename': 'first.pdf', 'response': {}, 'ocr_text': ocr_text},
+            {'filename': 'second.pdf', 'response': {}, 'ocr_text': ocr_text},
+        ]
+        mock_processor_class.return_value = mock_processor
+        
+        ProcessingService().process_all_invoices('invoices', str(tmp_path))
+        
+        lines = (tmp_path / 'all_invoices.jsonl').read_text().splitlines()
+        assert [json.loads(line) for line in lines] == [
+            json.loads((tmp_path / 'first.json').read_text()),
+            json.loads((tmp_path / 'second.json').read_text()),
+        ]
+        assert not (tmp_path / 'all_invoices.json').exists()
+    
+    @patch('src.services.processing_service.DocumentProcessor')
+    def test_shared_service_processes_every_batch(self, mock_processor_class, tmp_path):
+        """Test the shared CLI service runs each batch, even after earlier calls."""
+        import main
+        
+        mock_processor = Mock()
+        mock_processor.process_all_documents.return_value = [
+            {'filename': 'first.pdf', 'response': {}, 'ocr_text': 'Just random text'},
+        ]
+        mock_processor_class.return_value = mock_processor
+        
+        main._get_service.cache_clear()
+        try:
+            service = main._get_service()
+            first = service.process_all_invoices('x', str(tmp_path))
+            second = main._get_service().process_all_invoices('y', str(tmp_path))
+        finally:
+            main._get_service.cache_clear()
+        
+        assert first['total'] == 1
+        assert second['total'] == 1
+        assert [c.args[0] for c in mock_processor_class.call_args_list] == ['x', 'y']
+        assert mock_processor.process_all_documents.call_count == 2
+
 
+class TestDocumentProcessor:
+    """Test DocumentProcessor batch processing."""
+    
+    @patch('src.processors.document_processor.settings')
+    @patch('src.processors.document_processor.VeryfiClient')
+    def test_process_all_documents_parallel_preserves_order(
+        self, mock_client_class, mock_settings, tmp_path
+    ):
+        """Test parallel processing returns results in file order."""
+        mock_settings.enable_parallel_processing = True
+        mock_settings.max_workers = 4
+        for name in ['a.pdf', 'b.pdf', 'c.pdf']:
+            (tmp_path / name).write_bytes(b'%PDF')
+        mock_client_class.get_file_hash.side_effect = lambda path: path
+        mock_client_class.return_value.get_full_response.side_effect = (
+            lambda path: {'ocr_text': Path(path).name}
+        )
+        
+        processor = DocumentProcessor(str(tmp_path))
+        expected = [p.name for p in processor.get_pdf_files()]
+        results = processor.process_all_documents()
+        
+        assert [r['filename'] for r in results] == expected
+        assert [r['ocr_text'] for r in results] == expected
+    
+    @patch('src.processors.document_processor.VeryfiClient')
+    def test_process_all_documents_deduplicates_identical_files(
+        self, mock_client_class, tmp_path
+    ):
+        """Test identical files are sent to the API once and reported per file."""
+        (tmp_path / 'a.pdf').write_bytes(b'%PDF same')
+        (tmp_path / 'b.pdf').write_bytes(b'%PDF same')
+        (tmp_path / 'c.pdf').write_bytes(b'%PDF other')
+        mock_client_class.get_file_hash.side_effect = lambda path: Path(path).read_text()
+        mock_client_class.return_value.get_full_response.return_value = {'ocr_text': 'text'}
+        
+        processor = DocumentProcessor(str(tmp_path))
+        results = processor.process_all_documents()
+        
+        assert mock_client_class.return_value.get_full_response.call_count == 2
+        assert sorted(r['filename'] for r in results) == ['a.pdf', 'b.pdf', 'c.pdf']
+        assert all(Path(r['file_path']).name == r['filename'] for r in results)
@@ -3,7 +3,9 @@ Unit tests for structured data extraction from Veryfi API response.
 """
 
 import pytest
+from unittest.mock import patch
 from src.extractors.structured_extractor import StructuredExtractor
+from src.extractors import hybrid_extractor
 from src.extractors.hybrid_extractor import HybridExtractor
 
 
@@ -63,6 +65,28 @@ class TestStructuredExtraction:
         assert invoice_data['vendor_name'] == 'Structured Vendor Name'
         assert invoice_data['vendor_name'] != 'Page 1 of 2'
     
+    def test_hybrid_extraction_skips_ocr_when_structured_complete(self):
+        """Test the OCR pass is skipped when structured data has every field."""
+        response = {
+            'vendor': {
+                'name': {'value': 'Test Vendor'},
+                'address': {'value': '123 Test St'}
+            },
+            'bill_to': {
+                'name': 'Test Customer'
+            },
+            'invoice_number': 'INV-001',
+            'date': '2024-01-15 00:00:00',
+            'ocr_text': 'Some other text'
+        }
+        with patch.object(hybrid_extractor.settings, 'use_structured_data', True), \
+                patch.object(self.hybrid_extractor.ocr_extractor, 'extract_all_fields') as ocr_pass:
+            invoice_data = self.hybrid_extractor.extract_all_fields(response=response)
+        
+        ocr_pass.assert_not_called()
+        assert invoice_data['vendor_name'] == 'Test Vendor'
+        assert invoice_data['invoice_number'] == 'INV-001'
+    
     def test_hybrid_extraction_ocr_fallback(self):
         """Test hybrid extraction falls back to OCR when structured data missing."""
         response = {
@@ -81,4 +105,25 @@ class TestStructuredExtraction:
         invoice_data = self.hybrid_extractor.extract_all_fields(response=response)
         # Should extract from OCR text
         assert invoice_data['vendor_name'] is not None or invoice_data['invoice_number'] is not None
-
+    
+    def test_extract_structured_field_alternative_paths(self):
+        """Test structured field lookup unwraps values and tries alternatives in order."""
+        from src.clients.veryfi_client import VeryfiClient
+        
+        response = {
+            'vendor': {
+                'name': {'value': None},
+                'raw_name': {'value': 'Raw Vendor'}
+            }
+        }
+        value = VeryfiClient.extract_structured_field(
+            response,
+            ['vendor', 'name'],
+            alternative_paths=[['vendor', 'missing'], ['vendor', 'raw_name']]
+        )
+        
+        assert value == 'Raw Vendor'
+        assert VeryfiClient.safe_get_nested_value(response, 'vendor', 'x', default='d') == 'd'
+        assert VeryfiClient.safe_get_nested_value(response, 'vendor', 'raw_name') == 'Raw Vendor'
+        # An explicit {'value': None} node is returned as-is, not replaced by the default
+        assert VeryfiClient.safe_get_nested_value(response, 'vendor', 'name', default='D') is None